@@ -2,14 +2,69 @@
 Build script for Windows desktop (Steam ready)
 """
 
+import argparse
 import subprocess
 import sys
 import os
 import shutil
 
 
-def build_desktop():
-    """Build Windows .exe using PyInstaller."""
+def _run_streaming(cmd, cwd=None, env=None, log_path=None):
+    """Run a command, echoing its combined stdout/stderr line by line.
+
+    Output is forwarded as it arrives (never accumulated in memory) and,
+    when log_path is given, tee'd to that file as well.
+
+    Returns:
+        The process exit code
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=4096,
+        text=True,
+    )
+    log = open(log_path, "w", encoding="utf-8") if log_path else None
+    try:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            if log:
+                log.write(line)
+    finally:
+        proc.stdout.close()
+        if log:
+            log.close()
+    return proc.wait()
+
+
+def _publish_executable(src, dst):
+    """Move or copy the built executable into the release folder.
+
+    On the same volume this is a rename (no data copied). Across volumes
+    shutil.copyfile is used, which takes the OS fast-copy path where
+    available (sendfile/fcopyfile).
+
+    Returns:
+        "moved" or "copied"
+    """
+    if os.stat(src).st_dev == os.stat(os.path.dirname(dst)).st_dev:
+        os.replace(src, dst)
+        return "moved"
+    shutil.copyfile(src, dst)
+    return "copied"
+
+
+def build_desktop(onefile=True, clean=False):
+    """Build Windows .exe using PyInstaller.
+
+    Args:
+        onefile: Bundle into a single .exe (release). When False, build the
+            faster folder layout for local iteration and skip the release copy.
+        clean: Discard PyInstaller's cached analysis before building
+    """
     print("="*60)
     print("BUILDING WINDOWS DESKTOP VERSION")
     print("="*60)
@@ -23,9 +78,8 @@ def build_desktop():
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
         print("✓ PyInstaller installed")
     
-    # Change to infinite-tower-engine directory
+    # Build from the infinite-tower-engine directory (passed as cwd, no chdir)
     engine_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "infinite-tower-engine")
-    os.chdir(engine_dir)
     
     print("\n✓ Building Windows executable...")
     
@@ -33,40 +87,56 @@ def build_desktop():
     cmd = [
         "pyinstaller",
         "--name=InfiniteTower",
-        "--onefile",                          # Single executable
+        "--onefile" if onefile else "--onedir",  # Single executable / fast dev folder
         "--windowed",                         # No console window
+        "--noconfirm",                        # Overwrite previous dist output
         "--add-data=src;src",                 # Include source code
+        "--workpath=build/desktop",           # Persistent work dir (analysis cache)
         # Uncomment when you have assets:
         # "--add-data=assets;assets",         # Include assets
         # "--icon=assets/icon.ico",           # App icon
-        "demo_16bit_ui.py"                    # Entry point
     ]
+    if clean:
+        cmd.append("--clean")                 # Rebuild analysis from scratch
+    cmd.append("run_desktop_game.py")         # Entry point
+    
+    # Fixed hash seed keeps the bundled bytecode stable so cached analysis is reused
+    env = dict(os.environ, PYTHONHASHSEED="0")
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        log_path = os.path.join(engine_dir, "build.log")
+        returncode = _run_streaming(cmd, cwd=engine_dir, env=env, log_path=log_path)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✓ Build successful!")
-            print(f"\nExecutable location: {os.path.join(engine_dir, 'dist', 'InfiniteTower.exe')}")
-            print("\nNext steps for Steam:")
-            print("  1. Test the .exe thoroughly")
-            print("  2. Create Steam App ID")
-            print("  3. Add Steamworks SDK integration")
-            print("  4. Package with Steam installer")
-            print("  5. Upload to Steam Partner portal")
-            
+            if not onefile:
+                print(f"\nDev build location: {os.path.join(engine_dir, 'dist', 'InfiniteTower')}")
+                return True
             # Create a release folder
             release_dir = os.path.join(engine_dir, "release")
             os.makedirs(release_dir, exist_ok=True)
             
             exe_path = os.path.join(engine_dir, "dist", "InfiniteTower.exe")
             if os.path.exists(exe_path):
-                shutil.copy(exe_path, os.path.join(release_dir, "InfiniteTower.exe"))
-                print(f"\n✓ Executable copied to: {release_dir}")
+                release_exe = os.path.join(release_dir, "InfiniteTower.exe")
+                action = _publish_executable(exe_path, release_exe)
+                # A move leaves nothing in dist/, so only report paths that still exist
+                if action == "moved":
+                    print(f"\nExecutable location: {release_exe}")
+                else:
+                    print(f"\nExecutable location: {exe_path}")
+                    print(f"✓ Executable {action} to: {release_dir}")
+            
+            print("\nNext steps for Steam:")
+            print("  1. Test the .exe thoroughly")
+            print("  2. Create Steam App ID")
+            print("  3. Add Steamworks SDK integration")
+            print("  4. Package with Steam installer")
+            print("  5. Upload to Steam Partner portal")
                 
         else:
-            print("✗ Build failed!")
-            print(result.stderr)
+            print(f"✗ Build failed! (exit code {returncode})")
+            print(f"  Full output saved to: {log_path}")
             return False
             
     except Exception as e:
@@ -77,5 +147,11 @@ def build_desktop():
 
 
 if __name__ == "__main__":
-    success = build_desktop()
+    parser = argparse.ArgumentParser(description="Build the Windows desktop version.")
+    parser.add_argument("--dev", action="store_true",
+                        help="fast folder build for local testing (no single .exe, no release copy)")
+    parser.add_argument("--clean", action="store_true",
+                        help="discard cached PyInstaller analysis and rebuild from scratch")
+    args = parser.parse_args()
+    success = build_desktop(onefile=not args.dev, clean=args.clean)
     sys.exit(0 if success else 1)
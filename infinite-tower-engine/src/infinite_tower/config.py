@@ -10,6 +10,8 @@ secret protection. Any unauthorized use, copying, or distribution is strictly
 prohibited and may result in legal action.
 """
 
+import json
+
 # Display Settings
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
@@ -73,6 +75,12 @@ INVENTORY_SLOTS = 40
 GRAVITY = 0.5
 FRICTION = 0.9
 MAX_VELOCITY = 10.0
+# Below this many enemies a plain loop beats building/querying the spatial grid
+SPATIAL_QUERY_MIN_ENEMIES = 32
+# From this many enemies, movement is integrated as one NumPy batch (EnemyManager)
+BATCH_ENEMY_UPDATE_MIN = 32
+# From this many enemies, the Numba kernel (if installed) runs across all cores
+PARALLEL_ENEMY_UPDATE_MIN = 4096
 
 # AI Settings
 AI_UPDATE_FREQUENCY = 1  # Updates per frame
@@ -80,6 +88,10 @@ AI_DETECTION_RANGE = 200
 AI_ATTACK_RANGE = 50
 # How far ahead (in pixels) idle enemies probe for walls to turn around
 AI_IDLE_AVOID_PROBE = 32
+# Non-boss enemies farther than this from the player (beyond every detection
+# range) only run their AI every AI_FAR_UPDATE_INTERVAL frames
+AI_FAR_DISTANCE = 1000
+AI_FAR_UPDATE_INTERVAL = 4
 
 # Game Settings
 STARTING_FLOOR = 1
@@ -119,55 +131,86 @@ COLOR_LEGENDARY = (255, 150, 0)
 class GameConfig:
     """
     Dynamic configuration manager with save/load support.
+    
+    Settings are plain slot attributes (config.frame_rate); get()/set() remain
+    for key-based access. Keys without a slot are kept in a side dict so files
+    from other versions still round-trip.
     """
     
+    __slots__ = (
+        # Graphics
+        'screen_width', 'screen_height', 'fullscreen', 'frame_rate', 'vsync',
+        # Audio
+        'master_volume', 'sfx_volume', 'music_volume', 'audio_enabled',
+        # Gameplay
+        'difficulty', 'permadeath', 'auto_save',
+        # Controls
+        'move_up', 'move_down', 'move_left', 'move_right',
+        'attack', 'interact', 'inventory', 'pause',
+        # Debug
+        'debug_mode', 'show_fps', 'show_hitboxes',
+        '_extra',
+    )
+    
     def __init__(self):
-        self.settings = {
-            # Graphics
-            'screen_width': SCREEN_WIDTH,
-            'screen_height': SCREEN_HEIGHT,
-            'fullscreen': FULLSCREEN,
-            'frame_rate': FRAME_RATE,
-            'vsync': True,
-            
-            # Audio
-            'master_volume': MASTER_VOLUME,
-            'sfx_volume': SOUND_EFFECTS_VOLUME,
-            'music_volume': MUSIC_VOLUME,
-            'audio_enabled': True,
-            
-            # Gameplay
-            'difficulty': 1.0,
-            'permadeath': PERMADEATH,
-            'auto_save': True,
-            
-            # Controls
-            'move_up': 'w',
-            'move_down': 's',
-            'move_left': 'a',
-            'move_right': 'd',
-            'attack': 'space',
-            'interact': 'e',
-            'inventory': 'i',
-            'pause': 'escape',
-            
-            # Debug
-            'debug_mode': DEBUG_MODE,
-            'show_fps': False,
-            'show_hitboxes': False,
-        }
+        # Graphics
+        self.screen_width = SCREEN_WIDTH
+        self.screen_height = SCREEN_HEIGHT
+        self.fullscreen = FULLSCREEN
+        self.frame_rate = FRAME_RATE
+        self.vsync = True
+        
+        # Audio
+        self.master_volume = MASTER_VOLUME
+        self.sfx_volume = SOUND_EFFECTS_VOLUME
+        self.music_volume = MUSIC_VOLUME
+        self.audio_enabled = True
+        
+        # Gameplay
+        self.difficulty = 1.0
+        self.permadeath = PERMADEATH
+        self.auto_save = True
+        
+        # Controls
+        self.move_up = 'w'
+        self.move_down = 's'
+        self.move_left = 'a'
+        self.move_right = 'd'
+        self.attack = 'space'
+        self.interact = 'e'
+        self.inventory = 'i'
+        self.pause = 'escape'
+        
+        # Debug
+        self.debug_mode = DEBUG_MODE
+        self.show_fps = False
+        self.show_hitboxes = False
+        
+        self._extra = {}
+    
+    @property
+    def settings(self) -> dict:
+        """Snapshot of all settings as a dict (used for saving)."""
+        settings = {key: getattr(self, key) for key in self.__slots__ if key != '_extra'}
+        settings.update(self._extra)
+        return settings
     
     def get(self, key: str, default=None):
         """Get a configuration value."""
-        return self.settings.get(key, default)
+        if key in self._extra:
+            return self._extra[key]
+        # Only settings slots; methods/properties like 'set' or 'settings' aren't settings
+        return getattr(self, key) if key in self.__slots__ and key != '_extra' else default
     
     def set(self, key: str, value):
         """Set a configuration value."""
-        self.settings[key] = value
+        if key in self.__slots__ and key != '_extra':
+            setattr(self, key, value)
+        else:
+            self._extra[key] = value
     
     def save_to_file(self, filepath: str = "config.json"):
         """Save configuration to file."""
-        import json
         try:
             with open(filepath, 'w') as f:
                 json.dump(self.settings, f, indent=4)
@@ -178,11 +221,11 @@ class GameConfig:
     
     def load_from_file(self, filepath: str = "config.json"):
         """Load configuration from file."""
-        import json
         try:
             with open(filepath, 'r') as f:
                 loaded_settings = json.load(f)
-                self.settings.update(loaded_settings)
+                for key, value in loaded_settings.items():
+                    self.set(key, value)
             return True
         except FileNotFoundError:
             print(f"Config file not found: {filepath}")
@@ -203,16 +246,17 @@ class GameConfig:
             True if all values are valid
         """
         # Validate screen dimensions
-        if self.settings['screen_width'] < 640 or self.settings['screen_height'] < 480:
+        if self.screen_width < 640 or self.screen_height < 480:
             return False
         
         # Validate volumes (0.0 to 1.0)
-        for key in ['master_volume', 'sfx_volume', 'music_volume']:
-            if not 0.0 <= self.settings[key] <= 1.0:
-                return False
+        if not (0.0 <= self.master_volume <= 1.0 and
+                0.0 <= self.sfx_volume <= 1.0 and
+                0.0 <= self.music_volume <= 1.0):
+            return False
         
         # Validate frame rate
-        if not 30 <= self.settings['frame_rate'] <= 240:
+        if not 30 <= self.frame_rate <= 240:
             return False
         
         return True
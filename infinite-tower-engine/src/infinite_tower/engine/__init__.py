@@ -1 +1,10 @@
-# This file is intentionally left blank.
\ No newline at end of file
+"""
+Infinite Tower Engine - Engine Core Module
+
+Copyright (c) 2025 CosmicPhoenix171. All Rights Reserved.
+"""
+
+from .scene import Scene, SceneManager
+from .scheduler import Scheduler, ScheduledTask, FrameRateManager
+
+__all__ = ['Scene', 'SceneManager', 'Scheduler', 'ScheduledTask', 'FrameRateManager']
\ No newline at end of file
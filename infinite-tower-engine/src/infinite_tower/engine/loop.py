@@ -1,17 +1,38 @@
 import pygame
 import sys
+import time
 
 class GameLoop:
+    # time.sleep() can overshoot by a millisecond or two; spin for the last stretch
+    SPIN_MARGIN = 0.002
+
     def __init__(self, game):
         self.game = game
         self.clock = pygame.time.Clock()
 
     def run(self):
+        target_dt = 1.0 / self.game.config.FRAME_RATE
+        # A vsynced GPU renderer blocks in present(); pacing on top of it only adds latency
+        vsync_paced = getattr(self.game, 'use_gpu', False) and getattr(self.game.config, 'GPU_VSYNC', True)
         while True:
+            frame_start = time.perf_counter()
             self.handle_events()
             self.update()
             self.render()
-            self.clock.tick(self.game.config.FRAME_RATE)
+            if not vsync_paced:
+                self._pace(target_dt, time.perf_counter() - frame_start)
+            self.clock.tick()  # Measure only; keeps clock.get_fps() working
+
+    def _pace(self, target_dt, elapsed):
+        """Wait out the rest of the frame: coarse sleep, then busy-wait the final SPIN_MARGIN."""
+        remaining = target_dt - elapsed
+        if remaining <= 0:
+            return
+        deadline = time.perf_counter() + remaining
+        if remaining > self.SPIN_MARGIN:
+            time.sleep(remaining - self.SPIN_MARGIN)
+        while time.perf_counter() < deadline:
+            pass
 
     def handle_events(self):
         for event in pygame.event.get():
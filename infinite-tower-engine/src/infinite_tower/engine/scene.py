@@ -9,6 +9,9 @@ from typing import Optional, Dict, Any
 from abc import ABC, abstractmethod
 from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, GREEN, RED
 
+# Keys that activate the selected menu option
+_CONFIRM_KEYS = frozenset((pygame.K_RETURN, pygame.K_SPACE))
+
 
 class Scene(ABC):
     """
@@ -23,34 +26,38 @@ class Scene(ABC):
         self.is_active = False
         self.manager = None  # Reference to SceneManager
         self.transition_to = None  # Scene to transition to
+        # Skip calling lifecycle hooks the subclass doesn't override
+        self._has_on_enter = type(self).on_enter is not Scene.on_enter
+        self._has_on_exit = type(self).on_exit is not Scene.on_exit
     
     def activate(self):
         """Activate this scene."""
         self.is_active = True
-        self.on_enter()
+        if self._has_on_enter:
+            self.on_enter()
     
     def deactivate(self):
         """Deactivate this scene."""
         self.is_active = False
-        self.on_exit()
+        if self._has_on_exit:
+            self.on_exit()
     
-    @abstractmethod
     def on_enter(self):
-        """Called when scene becomes active."""
+        """Called when scene becomes active (optional hook)."""
         pass
     
-    @abstractmethod
     def on_exit(self):
-        """Called when scene becomes inactive."""
+        """Called when scene becomes inactive (optional hook)."""
         pass
     
     @abstractmethod
-    def handle_events(self, events: list):
+    def handle_events(self, keydowns: list, events: list):
         """
         Handle pygame events.
         
         Args:
-            events: List of pygame events
+            keydowns: The KEYDOWN events from events (filtered once by SceneManager)
+            events: List of all pygame events this frame
         """
         pass
     
@@ -84,6 +91,62 @@ class Scene(ABC):
         self.transition_to = scene_name
 
 
+def _render_text(font: pygame.font.Font, text: str, color) -> pygame.Surface:
+    """
+    Render text once for caching, in the display's pixel format when possible.
+    
+    Args:
+        font: Font to render with
+        text: String to render
+        color: Text color
+        
+    Returns:
+        Antialiased text surface (converted if a display mode is set)
+    """
+    surface = font.render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+def _render_options(font: pygame.font.Font, options: list, start_y: int, spacing: int) -> list:
+    """
+    Pre-render a vertical list of menu options.
+    
+    Every option is rendered in both colors once, and the complete blit list
+    is built for each possible selection, so drawing is a single blits() call.
+    
+    Args:
+        font: Font to render with
+        options: Option labels, top to bottom
+        start_y: Center y of the first option
+        spacing: Vertical distance between option centers
+        
+    Returns:
+        List indexed by selected option of (blit_sequence, highlight_rect)
+    """
+    normal, selected, rects = [], [], []
+    for i, option in enumerate(options):
+        normal.append(_render_text(font, option, WHITE))
+        selected.append(_render_text(font, option, GREEN))
+        rects.append(normal[i].get_rect(center=(SCREEN_WIDTH // 2, start_y + i * spacing)))
+    
+    layouts = []
+    for sel in range(len(options)):
+        sequence = [(selected[i] if i == sel else normal[i], rects[i]) for i in range(len(options))]
+        layouts.append((sequence, rects[sel].inflate(20, 10)))
+    return layouts
+
+
+def _draw_options(surface: pygame.Surface, layouts: list, selected_option: int):
+    """Blit pre-rendered options, outlining the selected one."""
+    sequence, highlight_rect = layouts[selected_option]
+    # A 2px outline via draw.rect is ~10x cheaper than blitting a
+    # prerendered outline surface of the same size
+    pygame.draw.rect(surface, GREEN, highlight_rect, 2)
+    surface.blits(sequence, doreturn=False)
+
+
 class MenuScene(Scene):
     """Main menu scene."""
     
@@ -93,37 +156,40 @@ class MenuScene(Scene):
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 32)
         self.selected_option = 0
-        self.menu_options = ["Start Game", "Settings", "Quit"]
+        # (label, action) pairs; selecting an option just calls its action
+        self._entries = [
+            ("Start Game", lambda: self.request_transition("game")),
+            ("Settings", lambda: self.request_transition("settings")),
+            ("Quit", lambda: pygame.event.post(pygame.event.Event(pygame.QUIT))),
+        ]
+        self.menu_options = [label for label, _ in self._entries]
+        
+        # All menu text is static; render it once so draw() only blits
+        self._title = _render_text(self.font_large, "INFINITE TOWER", WHITE)
+        self._title_rect = self._title.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        self._subtitle = _render_text(self.font_small, "Engine v0.1.0", (150, 150, 150))
+        self._subtitle_rect = self._subtitle.get_rect(center=(SCREEN_WIDTH // 2, 210))
+        self._options = _render_options(self.font_medium, self.menu_options, 300, 60)
+        self._instr = _render_text(self.font_small, "Use Arrow Keys and ENTER", (100, 100, 100))
+        self._instr_rect = self._instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
     
     def on_enter(self):
         """Initialize menu."""
         self.selected_option = 0
     
-    def on_exit(self):
-        """Clean up menu."""
-        pass
-    
-    def handle_events(self, events: list):
+    def handle_events(self, keydowns: list, events: list):
         """Handle menu input."""
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.selected_option = (self.selected_option - 1) % len(self.menu_options)
-                elif event.key == pygame.K_DOWN:
-                    self.selected_option = (self.selected_option + 1) % len(self.menu_options)
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    self._select_option()
+        for event in keydowns:
+            if event.key == pygame.K_UP:
+                self.selected_option = (self.selected_option - 1) % len(self.menu_options)
+            elif event.key == pygame.K_DOWN:
+                self.selected_option = (self.selected_option + 1) % len(self.menu_options)
+            elif event.key in _CONFIRM_KEYS:
+                self._select_option()
     
     def _select_option(self):
         """Handle menu option selection."""
-        option = self.menu_options[self.selected_option]
-        
-        if option == "Start Game":
-            self.request_transition("game")
-        elif option == "Settings":
-            self.request_transition("settings")
-        elif option == "Quit":
-            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        self._entries[self.selected_option][1]()
     
     def update(self, dt: float):
         """Update menu (animations, etc)."""
@@ -134,35 +200,16 @@ class MenuScene(Scene):
         surface.fill(BLACK)
         
         # Title
-        title = self.font_large.render("INFINITE TOWER", True, WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        surface.blit(title, title_rect)
+        surface.blit(self._title, self._title_rect)
         
         # Subtitle
-        subtitle = self.font_small.render("Engine v0.1.0", True, (150, 150, 150))
-        subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 210))
-        surface.blit(subtitle, subtitle_rect)
+        surface.blit(self._subtitle, self._subtitle_rect)
         
-        # Menu options
-        start_y = 300
-        spacing = 60
-        
-        for i, option in enumerate(self.menu_options):
-            color = GREEN if i == self.selected_option else WHITE
-            text = self.font_medium.render(option, True, color)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * spacing))
-            
-            # Highlight selected option
-            if i == self.selected_option:
-                highlight_rect = text_rect.inflate(20, 10)
-                pygame.draw.rect(surface, color, highlight_rect, 2)
-            
-            surface.blit(text, text_rect)
+        # Menu options (selected one highlighted)
+        _draw_options(surface, self._options, self.selected_option)
         
         # Instructions
-        instr = self.font_small.render("Use Arrow Keys and ENTER", True, (100, 100, 100))
-        instr_rect = instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        surface.blit(instr, instr_rect)
+        surface.blit(self._instr, self._instr_rect)
 
 
 class GameScene(Scene):
@@ -173,21 +220,11 @@ class GameScene(Scene):
         self.game = game_instance
         self.paused = False
     
-    def on_enter(self):
-        """Start gameplay."""
-        # Initialize game elements here
-        pass
-    
-    def on_exit(self):
-        """Clean up gameplay."""
-        pass
-    
-    def handle_events(self, events: list):
+    def handle_events(self, keydowns: list, events: list):
         """Handle gameplay input."""
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.request_transition("pause")
+        for event in keydowns:
+            if event.key == pygame.K_ESCAPE:
+                self.request_transition("pause")
     
     def update(self, dt: float):
         """Update gameplay."""
@@ -209,8 +246,24 @@ class PauseScene(Scene):
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
         self.selected_option = 0
-        self.menu_options = ["Resume", "Settings", "Main Menu"]
+        # (label, action) pairs; selecting an option just calls its action
+        self._entries = [
+            ("Resume", lambda: self.request_transition("game")),
+            ("Settings", lambda: self.request_transition("settings")),
+            ("Main Menu", lambda: self.request_transition("menu")),
+        ]
+        self.menu_options = [label for label, _ in self._entries]
         self.background_surface = None
+        
+        # Semi-transparent overlay and static text, built once
+        self._overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            self._overlay = self._overlay.convert()
+        self._overlay.set_alpha(180)
+        self._overlay.fill(BLACK)
+        self._title = _render_text(self.font_large, "PAUSED", WHITE)
+        self._title_rect = self._title.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        self._options = _render_options(self.font_medium, self.menu_options, 300, 60)
     
     def on_enter(self):
         """Capture game screen for background."""
@@ -220,29 +273,21 @@ class PauseScene(Scene):
         """Resume game."""
         self.background_surface = None
     
-    def handle_events(self, events: list):
+    def handle_events(self, keydowns: list, events: list):
         """Handle pause menu input."""
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.request_transition("game")
-                elif event.key == pygame.K_UP:
-                    self.selected_option = (self.selected_option - 1) % len(self.menu_options)
-                elif event.key == pygame.K_DOWN:
-                    self.selected_option = (self.selected_option + 1) % len(self.menu_options)
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    self._select_option()
+        for event in keydowns:
+            if event.key == pygame.K_ESCAPE:
+                self.request_transition("game")
+            elif event.key == pygame.K_UP:
+                self.selected_option = (self.selected_option - 1) % len(self.menu_options)
+            elif event.key == pygame.K_DOWN:
+                self.selected_option = (self.selected_option + 1) % len(self.menu_options)
+            elif event.key in _CONFIRM_KEYS:
+                self._select_option()
     
     def _select_option(self):
         """Handle pause menu option selection."""
-        option = self.menu_options[self.selected_option]
-        
-        if option == "Resume":
-            self.request_transition("game")
-        elif option == "Settings":
-            self.request_transition("settings")
-        elif option == "Main Menu":
-            self.request_transition("menu")
+        self._entries[self.selected_option][1]()
     
     def update(self, dt: float):
         """Update pause menu."""
@@ -251,30 +296,13 @@ class PauseScene(Scene):
     def draw(self, surface: pygame.Surface):
         """Render pause menu."""
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._overlay, (0, 0))
         
         # Title
-        title = self.font_large.render("PAUSED", True, WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        surface.blit(title, title_rect)
+        surface.blit(self._title, self._title_rect)
         
         # Menu options
-        start_y = 300
-        spacing = 60
-        
-        for i, option in enumerate(self.menu_options):
-            color = GREEN if i == self.selected_option else WHITE
-            text = self.font_medium.render(option, True, color)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * spacing))
-            
-            if i == self.selected_option:
-                highlight_rect = text_rect.inflate(20, 10)
-                pygame.draw.rect(surface, color, highlight_rect, 2)
-            
-            surface.blit(text, text_rect)
+        _draw_options(surface, self._options, self.selected_option)
 
 
 class SettingsScene(Scene):
@@ -285,21 +313,20 @@ class SettingsScene(Scene):
         self.font_large = pygame.font.Font(None, 64)
         self.font_medium = pygame.font.Font(None, 42)
         self.font_small = pygame.font.Font(None, 32)
-    
-    def on_enter(self):
-        """Initialize settings."""
-        pass
-    
-    def on_exit(self):
-        """Save settings."""
-        pass
-    
-    def handle_events(self, events: list):
+        
+        # Static text, rendered once
+        self._title = _render_text(self.font_large, "SETTINGS", WHITE)
+        self._title_rect = self._title.get_rect(center=(SCREEN_WIDTH // 2, 100))
+        self._placeholder = _render_text(self.font_medium, "Settings Coming Soon...", WHITE)
+        self._placeholder_rect = self._placeholder.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self._instr = _render_text(self.font_small, "Press ESC to go back", (100, 100, 100))
+        self._instr_rect = self._instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
+    
+    def handle_events(self, keydowns: list, events: list):
         """Handle settings input."""
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.request_transition("menu")
+        for event in keydowns:
+            if event.key == pygame.K_ESCAPE:
+                self.request_transition("menu")
     
     def update(self, dt: float):
         """Update settings."""
@@ -309,19 +336,13 @@ class SettingsScene(Scene):
         """Render settings."""
         surface.fill(BLACK)
         
-        title = self.font_large.render("SETTINGS", True, WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        surface.blit(title, title_rect)
+        surface.blit(self._title, self._title_rect)
         
         # Placeholder text
-        text = self.font_medium.render("Settings Coming Soon...", True, WHITE)
-        text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        surface.blit(text, text_rect)
+        surface.blit(self._placeholder, self._placeholder_rect)
         
         # Instructions
-        instr = self.font_small.render("Press ESC to go back", True, (100, 100, 100))
-        instr_rect = instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        surface.blit(instr, instr_rect)
+        surface.blit(self._instr, self._instr_rect)
 
 
 class SceneManager:
@@ -363,29 +384,44 @@ class SceneManager:
             self.active_scene.activate()
             self.active_scene.transition_to = None
     
+    @staticmethod
+    def _suspend(scene: Scene):
+        """Pause a scene under an overlay (no on_exit; it is coming back)."""
+        scene.is_active = False
+    
+    @staticmethod
+    def _resume(scene: Scene):
+        """Resume a suspended scene (no on_enter; it never left)."""
+        scene.is_active = True
+        scene.transition_to = None
+    
     def push_scene(self, scene_name: str):
         """
         Push a scene onto the stack (for overlays).
         
+        The covered scene is suspended, not deactivated: its on_exit does not
+        run, and pop_scene() resumes it without on_enter.
+        
         Args:
             scene_name: Name of scene to push
         """
         if self.active_scene:
             self.scene_stack.append(self.active_scene)
-            self.active_scene.is_active = False
+            self._suspend(self.active_scene)
         
         self.active_scene = self.scenes.get(scene_name)
         if self.active_scene:
             self.active_scene.activate()
+            self.active_scene.transition_to = None
     
     def pop_scene(self):
-        """Pop the top scene from the stack."""
+        """Pop the top scene from the stack, resuming the one beneath it."""
         if self.active_scene:
             self.active_scene.deactivate()
         
         if self.scene_stack:
             self.active_scene = self.scene_stack.pop()
-            self.active_scene.is_active = True
+            self._resume(self.active_scene)
         else:
             self.active_scene = None
     
@@ -396,8 +432,11 @@ class SceneManager:
         Args:
             events: List of pygame events
         """
-        if self.active_scene:
-            self.active_scene.handle_events(events)
+        scene = self.active_scene
+        if scene:
+            # Every scene only reacts to key presses; filter them once here
+            keydowns = [event for event in events if event.type == pygame.KEYDOWN]
+            scene.handle_events(keydowns, events)
     
     def update(self, dt: float):
         """
@@ -406,12 +445,13 @@ class SceneManager:
         Args:
             dt: Delta time
         """
-        if self.active_scene:
-            self.active_scene.update(dt)
+        scene = self.active_scene
+        if scene:
+            scene.update(dt)
             
             # Check for scene transition request
-            if self.active_scene.transition_to:
-                self.switch_to(self.active_scene.transition_to)
+            if scene.transition_to:
+                self.switch_to(scene.transition_to)
     
     def draw(self, surface: pygame.Surface):
         """
@@ -420,8 +460,9 @@ class SceneManager:
         Args:
             surface: Pygame surface to draw on
         """
-        if self.active_scene:
-            self.active_scene.draw(surface)
+        scene = self.active_scene
+        if scene:
+            scene.draw(surface)
     
     def get_active_scene(self) -> Optional[Scene]:
         """Get the currently active scene."""
@@ -4,19 +4,28 @@ Infinite Tower Engine - Task Scheduler Module
 Copyright (c) 2025 CosmicPhoenix171. All Rights Reserved.
 """
 
-from typing import Callable, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from collections import deque
+import heapq
+import itertools
 import time
 
+# Monotonic, high-resolution clock for all timing in this module
+_now = time.perf_counter
+
 
 class ScheduledTask:
     """
     Represents a scheduled task with timing information.
     """
     
+    __slots__ = ('callback', 'delay', 'initial_delay', 'repeat', 'repeat_interval',
+                 'task_id', 'active', 'execution_count')
+    
     def __init__(self, callback: Callable, delay: float, repeat: bool = False, 
                  repeat_interval: float = 0, task_id: Optional[str] = None):
         self.callback = callback
-        self.delay = delay  # Time until next execution (in seconds or frames)
+        self.delay = delay  # Delay the task was last scheduled with (in seconds or frames)
         self.initial_delay = delay
         self.repeat = repeat
         self.repeat_interval = repeat_interval
@@ -57,6 +66,10 @@ class Scheduler:
     - Repeating tasks
     - Frame-based or time-based timing
     - Task cancellation and management
+    
+    Tasks live in a min-heap keyed on absolute fire time, so update() only
+    touches the tasks that are due. Cancelled tasks are dropped lazily when
+    they reach the top of the heap.
     """
     
     def __init__(self, use_real_time: bool = False):
@@ -66,12 +79,27 @@ class Scheduler:
         Args:
             use_real_time: If True, use real time (seconds). If False, use frame count.
         """
-        self.timed_tasks: List[ScheduledTask] = []
+        self._heap: List[Tuple[float, int, ScheduledTask]] = []  # (fire_at, seq, task)
+        self._seq = itertools.count()  # Tie-breaker: equal fire times run in the order tasks were added
+        self._clock = 0.0  # Sum of all delta_time passed to update()
+        self._cancelled = 0  # Cancelled tasks still sitting in the heap
+        self._task_index: Dict[str, ScheduledTask] = {}  # task_id -> scheduled task
         self.use_real_time = use_real_time
         self.total_time = 0.0
         self.frame_count = 0
         self.task_id_counter = 0
     
+    @property
+    def timed_tasks(self) -> List[ScheduledTask]:
+        """Tasks currently held by the scheduler (in heap order)."""
+        return [task for _, _, task in self._heap]
+    
+    def _schedule(self, task: ScheduledTask, delay: float, seq: Optional[int] = None):
+        """Push task to fire delay units from now (seq keeps its place among ties)."""
+        if seq is None:
+            seq = next(self._seq)
+        heapq.heappush(self._heap, (self._clock + delay, seq, task))
+    
     def add_task(self, callback: Callable, delay: float, 
                  task_id: Optional[str] = None) -> ScheduledTask:
         """
@@ -90,7 +118,8 @@ class Scheduler:
             self.task_id_counter += 1
         
         task = ScheduledTask(callback, delay, repeat=False, task_id=task_id)
-        self.timed_tasks.append(task)
+        self._schedule(task, delay)
+        self._task_index[task_id] = task
         return task
     
     def add_repeating_task(self, callback: Callable, interval: float,
@@ -115,7 +144,8 @@ class Scheduler:
         delay = initial_delay if initial_delay is not None else interval
         task = ScheduledTask(callback, delay, repeat=True, 
                            repeat_interval=interval, task_id=task_id)
-        self.timed_tasks.append(task)
+        self._schedule(task, delay)
+        self._task_index[task_id] = task
         return task
     
     def add_event(self, event: Callable, delay: float):
@@ -132,27 +162,45 @@ class Scheduler:
         """
         Cancel a task by ID.
         
+        If several scheduled tasks share an ID, the most recently added one
+        is cancelled.
+        
         Args:
             task_id: Task identifier
             
         Returns:
             True if task was found and cancelled
         """
-        for task in self.timed_tasks:
-            if task.task_id == task_id:
-                task.cancel()
-                return True
-        return False
+        task = self._task_index.pop(task_id, None)
+        if task is None:
+            return False
+        task.cancel()
+        
+        # Compact once cancelled entries make up most of the heap
+        self._cancelled += 1
+        if self._cancelled * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if entry[2].active]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        return True
     
     def cancel_all_tasks(self):
         """Cancel all scheduled tasks."""
-        for task in self.timed_tasks:
+        for _, _, task in self._heap:
             task.cancel()
+        self._heap.clear()
+        self._task_index.clear()
+        self._cancelled = 0
     
     def update(self, delta_time: float):
         """
         Update all scheduled tasks.
         
+        Each task fires at most once per update; tasks scheduled from inside a
+        callback are first eligible on the next update. When nothing is due
+        this is a single comparison against the top of the heap. If a
+        callback raises, the exception propagates but no other task is lost.
+        
         Args:
             delta_time: Time elapsed since last update (seconds or 1 for frame-based)
         """
@@ -161,31 +209,47 @@ class Scheduler:
         else:
             self.frame_count += 1
         
-        # Update and execute tasks
-        tasks_to_remove = []
+        self._clock += delta_time
+        clock = self._clock
+        heap = self._heap
+        if not heap or heap[0][0] > clock:
+            return
         
-        for task in self.timed_tasks:
-            if not task.active:
-                tasks_to_remove.append(task)
-                continue
-            
-            task.delay -= delta_time
-            
-            if task.delay <= 0:
-                # Execute task
-                should_continue = task.execute()
-                
-                if not should_continue:
-                    tasks_to_remove.append(task)
+        # Collect everything due before running callbacks, so tasks they
+        # schedule (or reschedule) wait for the next update
+        due = []
+        heappop = heapq.heappop
+        while heap and heap[0][0] <= clock:
+            due.append(heappop(heap))
         
-        # Remove completed tasks
-        for task in tasks_to_remove:
-            if task in self.timed_tasks:
-                self.timed_tasks.remove(task)
+        task_index = self._task_index
+        schedule = self._schedule
+        pending = iter(due)
+        try:
+            for _, seq, task in pending:
+                if task.active:
+                    if task.repeat:
+                        # Reschedule before running, so the task keeps its
+                        # slot even if the callback raises
+                        schedule(task, task.repeat_interval, seq)
+                        task.execute()
+                        continue
+                    if task_index.get(task.task_id) is task:
+                        del task_index[task.task_id]
+                    task.execute()
+                else:
+                    if self._cancelled:
+                        self._cancelled -= 1
+                    if task_index.get(task.task_id) is task:
+                        del task_index[task.task_id]
+        finally:
+            # If a callback raised, put the due tasks that did not run yet back
+            for entry in pending:
+                heapq.heappush(heap, entry)
     
     def get_active_task_count(self) -> int:
         """Get number of active tasks."""
-        return len([t for t in self.timed_tasks if t.active])
+        return sum(1 for _, _, task in self._heap if task.active)
     
     def get_task(self, task_id: str) -> Optional[ScheduledTask]:
         """
@@ -195,16 +259,13 @@ class Scheduler:
             task_id: Task identifier
             
         Returns:
-            ScheduledTask or None
+            ScheduledTask or None (most recently added one if IDs repeat)
         """
-        for task in self.timed_tasks:
-            if task.task_id == task_id:
-                return task
-        return None
+        return self._task_index.get(task_id)
     
     def clear(self):
         """Remove all tasks."""
-        self.timed_tasks.clear()
+        self.cancel_all_tasks()
 
 
 class Timer:
@@ -212,6 +273,8 @@ class Timer:
     Simple timer for measuring elapsed time.
     """
     
+    __slots__ = ('start_time', 'elapsed_time', 'is_running')
+    
     def __init__(self):
         self.start_time = 0.0
         self.elapsed_time = 0.0
@@ -219,7 +282,7 @@ class Timer:
     
     def start(self):
         """Start the timer."""
-        self.start_time = time.time()
+        self.start_time = _now()
         self.is_running = True
     
     def stop(self) -> float:
@@ -230,7 +293,7 @@ class Timer:
             Elapsed time in seconds
         """
         if self.is_running:
-            self.elapsed_time = time.time() - self.start_time
+            self.elapsed_time = _now() - self.start_time
             self.is_running = False
         return self.elapsed_time
     
@@ -248,7 +311,7 @@ class Timer:
             Elapsed time in seconds
         """
         if self.is_running:
-            return time.time() - self.start_time
+            return _now() - self.start_time
         return self.elapsed_time
 
 
@@ -260,11 +323,12 @@ class FrameRateManager:
     def __init__(self, target_fps: int = 60):
         self.target_fps = target_fps
         self.target_frame_time = 1.0 / target_fps
-        self.last_frame_time = time.time()
+        self.last_frame_time = _now()
         self.delta_time = 0.0
         self.fps = 0.0
-        self.frame_times = []
         self.max_samples = 60
+        self.frame_times = deque(maxlen=self.max_samples)
+        self._frame_time_sum = 0.0  # Rolling sum of frame_times
     
     def tick(self) -> float:
         """
@@ -273,20 +337,27 @@ class FrameRateManager:
         Returns:
             Delta time in seconds
         """
-        current_time = time.time()
-        self.delta_time = current_time - self.last_frame_time
+        current_time = _now()
+        delta_time = current_time - self.last_frame_time
+        self.delta_time = delta_time
         self.last_frame_time = current_time
         
-        # Update FPS calculation
-        self.frame_times.append(self.delta_time)
-        if len(self.frame_times) > self.max_samples:
-            self.frame_times.pop(0)
+        # Update FPS calculation; the deque drops the oldest sample itself,
+        # so take it out of the rolling sum first
+        frame_times = self.frame_times
+        frame_time_sum = self._frame_time_sum
+        sample_count = len(frame_times)
+        if sample_count == self.max_samples:
+            frame_time_sum -= frame_times[0]
+        else:
+            sample_count += 1
+        frame_times.append(delta_time)
+        frame_time_sum += delta_time
+        self._frame_time_sum = frame_time_sum
         
-        if self.frame_times:
-            avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-            self.fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
+        self.fps = sample_count / frame_time_sum if frame_time_sum > 0 else 0
         
-        return self.delta_time
+        return delta_time
     
     def get_fps(self) -> float:
         """Get current FPS."""
@@ -6,12 +6,16 @@ Copyright (c) 2025 CosmicPhoenix171. All Rights Reserved.
 
 import pygame
 import random
-import math
+import itertools
 from typing import Tuple, Optional, List
 from enum import Enum
 from ..systems.ai import AI, AIBehaviorType
-from ..config import RED, WHITE, BLACK, SCREEN_WIDTH, SCREEN_HEIGHT
+from ..config import (RED, WHITE, BLACK, SCREEN_WIDTH, SCREEN_HEIGHT,
+                      AI_FAR_DISTANCE, AI_FAR_UPDATE_INTERVAL)
 from ..systems.physics import Physics
+from .facing import DIR_COS, DIR_SIN, dir_index, attack_rect_for
+
+_AI_FAR_DIST2 = AI_FAR_DISTANCE * AI_FAR_DISTANCE
 
 
 class EnemyType(Enum):
@@ -35,11 +39,21 @@ class Enemy:
         damage: Attack damage (attack_power)
         defense: Damage reduction
         speed: Movement speed
-        position: (x, y) position
+        pos_x, pos_y: Center position (read/write as a tuple via position)
         size: Sprite size
         ai: AI controller
         rect: Collision rectangle
     """
+
+    # Fixed attribute layout: no per-instance __dict__ for large enemy counts
+    __slots__ = (
+        'name', 'enemy_type', 'max_health', 'health', 'attack_power', 'damage',
+        'defense', 'speed', 'pos_x', 'pos_y', 'size', 'color', 'direction',
+        'direction_angle', 'vel_x', 'vel_y', 'rotation_speed', '_desired_angle',
+        '_move_intent', 'is_attacking', '_ai_tick', '_name_surf', '_name_label',
+        'attack_range', 'attack_cooldown', 'base_attack_cooldown', 'crit_chance',
+        'block_chance', 'rect', '_attack_rect', 'ai', '_half_size', '_rest',
+    )
     
     def __init__(self, name: str, health: int, damage: int, speed: float,
                  position: Tuple[float, float] = None, 
@@ -54,18 +68,26 @@ class Enemy:
         self.speed = speed
         
         # Position and rendering
-        self.position = list(position) if position else [100, 100]
+        self.pos_x, self.pos_y = position if position else (100, 100)
         self.size = 28
         self.color = self._get_color_for_type()
         self.direction = "down"
         # 360° facing and movement like the player
         self.direction_angle = 0.0  # degrees, 0=right, 90=down, 180=left, 270=up
-        self.velocity = [0.0, 0.0]
+        self.vel_x = 0.0
+        self.vel_y = 0.0
         self.rotation_speed = 5.0  # degrees per frame
         # Intent set by AI each frame
         self._desired_angle = 0.0
         self._move_intent = 0  # -1 back, 0 idle, +1 forward
+        # State after an idle step that changed nothing (see _rest_key)
+        self._rest = None
         self.is_attacking = False
+        # Frame counter for throttled AI when far away; staggered across enemies
+        self._ai_tick = next(Enemy._ai_phases) % AI_FAR_UPDATE_INTERVAL
+        # Rendered name label, redrawn only when the name changes
+        self._name_surf = None
+        self._name_label = None
         
         # Combat stats
         self.attack_range = 50
@@ -77,11 +99,12 @@ class Enemy:
         
         # Collision
         self.rect = pygame.Rect(
-            self.position[0] - self.size // 2,
-            self.position[1] - self.size // 2,
+            self.pos_x - self.size // 2,
+            self.pos_y - self.size // 2,
             self.size,
             self.size
         )
+        self._attack_rect = pygame.Rect(0, 0, 0, 0)  # Reused by get_attack_rect()
         
         # AI Controller
         ai_behavior = self._get_ai_behavior_for_type()
@@ -90,67 +113,78 @@ class Enemy:
         # Configure stats based on type
         self._configure_by_type()
     
+    # Display color per enemy type
+    _TYPE_COLORS = {
+        EnemyType.BASIC: (200, 50, 50),      # Red
+        EnemyType.TANK: (100, 100, 150),     # Blue-gray
+        EnemyType.RANGER: (150, 100, 200),   # Purple
+        EnemyType.FAST: (200, 150, 50),      # Orange
+        EnemyType.BOSS: (150, 0, 0),         # Dark red
+    }
+
+    # AI behavior per enemy type
+    _TYPE_BEHAVIORS = {
+        EnemyType.BASIC: AIBehaviorType.AGGRESSIVE,
+        EnemyType.TANK: AIBehaviorType.TANK,
+        EnemyType.RANGER: AIBehaviorType.RANGER,
+        EnemyType.FAST: AIBehaviorType.AGGRESSIVE,
+        EnemyType.BOSS: AIBehaviorType.AGGRESSIVE,
+    }
+
+    # Staggers each new enemy's far-AI frame so throttled enemies don't all think together
+    _ai_phases = itertools.count()
+
+    # Stats per enemy type: (health mult, speed mult, attack mult, size, defense,
+    # attack range, crit chance, block chance, base attack cooldown in frames)
+    _TYPE_STATS = {
+        EnemyType.BASIC: (1.0, 1.0, 1.0, 28, 0, 50, 0.05, 0.0, 90),
+        EnemyType.TANK: (2.0, 0.6, 1.0, 36, 5, 50, 0.05, 0.15, 120),    # Slower attack (2 seconds)
+        EnemyType.RANGER: (1.0, 0.8, 1.0, 28, 1, 150, 0.05, 0.0, 100),  # Medium attack (1.67 seconds)
+        EnemyType.FAST: (0.7, 1.5, 1.0, 24, 0, 50, 0.05, 0.0, 75),      # Faster attack (1.25 seconds)
+        EnemyType.BOSS: (5.0, 0.7, 2.0, 48, 10, 50, 0.15, 0.1, 100),    # Boss attack (1.67 seconds)
+    }
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        """(x, y) center position; stored as pos_x/pos_y."""
+        return (self.pos_x, self.pos_y)
+
+    @position.setter
+    def position(self, value: Tuple[float, float]):
+        self.pos_x, self.pos_y = value
+
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        """(x, y) velocity; stored as vel_x/vel_y."""
+        return (self.vel_x, self.vel_y)
+
+    @velocity.setter
+    def velocity(self, value: Tuple[float, float]):
+        self.vel_x, self.vel_y = value
+
     def _get_color_for_type(self) -> Tuple[int, int, int]:
         """Get display color based on enemy type."""
-        colors = {
-            EnemyType.BASIC: (200, 50, 50),      # Red
-            EnemyType.TANK: (100, 100, 150),     # Blue-gray
-            EnemyType.RANGER: (150, 100, 200),   # Purple
-            EnemyType.FAST: (200, 150, 50),      # Orange
-            EnemyType.BOSS: (150, 0, 0),         # Dark red
-        }
-        return colors.get(self.enemy_type, RED)
+        return self._TYPE_COLORS.get(self.enemy_type, RED)
     
     def _get_ai_behavior_for_type(self) -> AIBehaviorType:
         """Get AI behavior based on enemy type."""
-        behaviors = {
-            EnemyType.BASIC: AIBehaviorType.AGGRESSIVE,
-            EnemyType.TANK: AIBehaviorType.TANK,
-            EnemyType.RANGER: AIBehaviorType.RANGER,
-            EnemyType.FAST: AIBehaviorType.AGGRESSIVE,
-            EnemyType.BOSS: AIBehaviorType.AGGRESSIVE,
-        }
-        return behaviors.get(self.enemy_type, AIBehaviorType.AGGRESSIVE)
+        return self._TYPE_BEHAVIORS.get(self.enemy_type, AIBehaviorType.AGGRESSIVE)
     
     def _configure_by_type(self):
         """Configure enemy stats based on type."""
-        if self.enemy_type == EnemyType.TANK:
-            self.max_health = int(self.max_health * 2)
-            self.health = self.max_health
-            self.defense = 5
-            self.speed *= 0.6
-            self.size = 36
-            self.block_chance = 0.15
-            self.base_attack_cooldown = 120  # Slower attack (2 seconds)
-            
-        elif self.enemy_type == EnemyType.RANGER:
-            self.attack_range = 150
-            self.speed *= 0.8
-            self.defense = 1
-            self.base_attack_cooldown = 100  # Medium attack (1.67 seconds)
-            
-        elif self.enemy_type == EnemyType.FAST:
-            self.speed *= 1.5
-            self.health = int(self.health * 0.7)
-            self.max_health = self.health
-            self.size = 24
-            self.base_attack_cooldown = 75  # Faster attack (1.25 seconds)
-            
-        elif self.enemy_type == EnemyType.BOSS:
-            self.max_health = int(self.max_health * 5)
-            self.health = self.max_health
-            self.attack_power = int(self.attack_power * 2)
-            self.damage = self.attack_power
-            self.defense = 10
-            self.speed *= 0.7
-            self.size = 48
-            self.crit_chance = 0.15
-            self.block_chance = 0.1
-            self.base_attack_cooldown = 100  # Boss attack (1.67 seconds)
-        
-        # Update rect size
+        (hp_mul, speed_mul, atk_mul, self.size, self.defense, self.attack_range,
+         self.crit_chance, self.block_chance, self.base_attack_cooldown) = self._TYPE_STATS.get(
+            self.enemy_type, self._TYPE_STATS[EnemyType.BASIC])
+        self.max_health = int(self.max_health * hp_mul)
+        self.health = self.max_health
+        self.attack_power = int(self.attack_power * atk_mul)
+        self.damage = self.attack_power
+        self.speed *= speed_mul
+        
+        # Update rect size; size is fixed from here on, so halve it once
         self.rect.width = self.size
         self.rect.height = self.size
+        self._half_size = self.size // 2
     
     def update(self, player, dt: float = 1.0, obstacles: Optional[list] = None, bounds: Optional[tuple[int,int,int,int]] = None):
         """
@@ -165,8 +199,70 @@ class Enemy:
             return
         
         # Update AI (sets desired angle and move intent)
+        self._think(player, obstacles)
+        rest = self._rest_key()
+        if rest is not None and rest == self._rest:
+            return
+        self._integrate(dt, bounds)
+        self._settle(obstacles)
+        self._note_rest(rest)
+
+    def _rest_key(self) -> Optional[tuple]:
+        """
+        Snapshot of the state a step could change, if the enemy is idle this frame.
+        
+        Idle means no move intent, already facing the desired angle and no
+        attack in progress. If an idle step leaves the snapshot unchanged, the
+        next identical idle step would too, so it can be skipped.
+        
+        Returns:
+            (x, y, angle, rect x, rect y), or None when not idle
+        """
+        if (self._move_intent == 0 and self.attack_cooldown == 0 and not self.is_attacking
+                and self._desired_angle == self.direction_angle):
+            return (self.pos_x, self.pos_y, self.direction_angle, self.rect.x, self.rect.y)
+        return None
+
+    def _note_rest(self, rest: Optional[tuple]):
+        """
+        Remember whether the step just taken was a no-op.
+        
+        Args:
+            rest: _rest_key() from before the step
+        """
+        self._rest = rest if rest is not None and self._rest_key() == rest else None
+
+    def _think(self, player, obstacles: Optional[list]):
+        """
+        Run the AI, only every AI_FAR_UPDATE_INTERVAL frames when far from the player.
+        
+        In between, the enemy keeps acting on its last desired angle and move
+        intent. Bosses always think every frame.
+        
+        Args:
+            player: Player entity
+            obstacles: List of obstacle rects
+        """
+        if self.enemy_type is not EnemyType.BOSS:
+            dx = self.pos_x - player.position[0]
+            dy = self.pos_y - player.position[1]
+            if dx * dx + dy * dy > _AI_FAR_DIST2:
+                self._ai_tick = (self._ai_tick + 1) % AI_FAR_UPDATE_INTERVAL
+                if self._ai_tick:
+                    return
         self.ai.update(player, obstacles)
 
+    def _integrate(self, dt: float, bounds: Optional[tuple]):
+        """
+        Turn toward the desired angle, move along the facing and clamp to bounds.
+        
+        EnemyManager runs the same steps for many enemies at once; keep the two
+        in step.
+        
+        Args:
+            dt: Delta time
+            bounds: (min_x, min_y, max_x, max_y) world bounds, or None for the screen
+        """
         # Rotate toward desired angle (shortest arc)
         diff = (self._desired_angle - self.direction_angle + 540) % 360 - 180
         if diff > 0:
@@ -177,40 +273,46 @@ class Enemy:
 
         # Update movement based on facing and intent
         if self._move_intent != 0:
-            ang = math.radians(self.direction_angle)
-            self.velocity[0] = math.cos(ang) * self.speed * self._move_intent
-            self.velocity[1] = math.sin(ang) * self.speed * self._move_intent
+            i = dir_index(self.direction_angle)
+            self.vel_x = DIR_COS[i] * self.speed * self._move_intent
+            self.vel_y = DIR_SIN[i] * self.speed * self._move_intent
         else:
-            self.velocity[0] = 0.0
-            self.velocity[1] = 0.0
+            self.vel_x = 0.0
+            self.vel_y = 0.0
         
         # Apply movement
-        self.position[0] += self.velocity[0] * dt
-        self.position[1] += self.velocity[1] * dt
-        
-        # Update collision rect
-        self.rect.x = int(self.position[0] - self.size // 2)
-        self.rect.y = int(self.position[1] - self.size // 2)
+        self.pos_x += self.vel_x * dt
+        self.pos_y += self.vel_y * dt
         
         # Keep within bounds (world bounds preferred, screen as fallback)
-        half_size = self.size // 2
+        half_size = self._half_size
         if bounds:
             min_x, min_y, max_x, max_y = bounds
-            self.position[0] = max(min_x + half_size, min(self.position[0], max_x - half_size))
-            self.position[1] = max(min_y + half_size, min(self.position[1], max_y - half_size))
+            self.pos_x = max(min_x + half_size, min(self.pos_x, max_x - half_size))
+            self.pos_y = max(min_y + half_size, min(self.pos_y, max_y - half_size))
         else:
-            self.position[0] = max(half_size, min(self.position[0], SCREEN_WIDTH - half_size))
-            self.position[1] = max(half_size, min(self.position[1], SCREEN_HEIGHT - half_size))
-        # Sync rect after bounds clamp
-        self.rect.x = int(self.position[0] - self.size // 2)
-        self.rect.y = int(self.position[1] - self.size // 2)
+            self.pos_x = max(half_size, min(self.pos_x, SCREEN_WIDTH - half_size))
+            self.pos_y = max(half_size, min(self.pos_y, SCREEN_HEIGHT - half_size))
+
+    def _settle(self, obstacles: Optional[list], resolve: bool = True):
+        """
+        Sync the rect to the new position, push out of walls and tick cooldowns.
+        
+        Args:
+            obstacles: List of wall rects
+            resolve: False when a broadphase has already ruled out any wall overlap
+        """
+        # Sync rect after movement and bounds clamp (one write for both axes)
+        half_size = self._half_size
+        self.rect.topleft = (int(self.pos_x - half_size), int(self.pos_y - half_size))
         
         # Resolve collisions against static obstacles (e.g., walls)
         if obstacles:
-            self._resolve_wall_collisions(obstacles)
+            if resolve:
+                self._resolve_wall_collisions(obstacles)
             # Sync logical position to rect center after resolution
-            self.position[0] = self.rect.centerx
-            self.position[1] = self.rect.centery
+            self.pos_x = self.rect.centerx
+            self.pos_y = self.rect.centery
         
         # Update attack cooldown
         if self.attack_cooldown > 0:
@@ -220,27 +322,25 @@ class Enemy:
         if self.attack_cooldown == 0:
             self.is_attacking = False
 
-    def _resolve_wall_collisions(self, obstacles: Optional[List]):
+    def _resolve_wall_collisions(self, obstacles: List[pygame.Rect]):
         """
         Push the enemy out of any overlapping wall/obstacle using minimal overlap.
-        Accepts a list of Wall objects or pygame.Rects.
+        
+        Args:
+            obstacles: Wall rects (plain pygame.Rects, not Wall objects)
         """
-        if not obstacles:
-            return
-        for obj in obstacles:
-            wall_rect = getattr(obj, 'rect', obj)
-            if not isinstance(wall_rect, pygame.Rect):
-                continue
-            if self.rect.colliderect(wall_rect):
-                side = Physics.get_collision_side(self.rect, wall_rect, (0, 0))
+        rect = self.rect
+        for wall_rect in obstacles:
+            if rect.colliderect(wall_rect):
+                side = Physics.get_collision_side(rect, wall_rect, (0, 0))
                 if side == "left":
-                    self.rect.right = wall_rect.left
+                    rect.right = wall_rect.left
                 elif side == "right":
-                    self.rect.left = wall_rect.right
+                    rect.left = wall_rect.right
                 elif side == "top":
-                    self.rect.bottom = wall_rect.top
+                    rect.bottom = wall_rect.top
                 elif side == "bottom":
-                    self.rect.top = wall_rect.bottom
+                    rect.top = wall_rect.bottom
     
     def move(self, direction: str):
         """
@@ -250,17 +350,17 @@ class Enemy:
             direction: "up", "down", "left", or "right"
         """
         if direction == "up":
-            self.position[1] -= self.speed
+            self.pos_y -= self.speed
         elif direction == "down":
-            self.position[1] += self.speed
+            self.pos_y += self.speed
         elif direction == "left":
-            self.position[0] -= self.speed
+            self.pos_x -= self.speed
         elif direction == "right":
-            self.position[0] += self.speed
+            self.pos_x += self.speed
         
         self.direction = direction
-        self.rect.x = int(self.position[0] - self.size // 2)
-        self.rect.y = int(self.position[1] - self.size // 2)
+        half_size = self._half_size
+        self.rect.topleft = (int(self.pos_x - half_size), int(self.pos_y - half_size))
     
     def attack(self, target):
         """
@@ -294,68 +394,20 @@ class Enemy:
         """Check if enemy is still alive."""
         return self.health > 0
     
+    # Shared by all enemies' name labels; created on first draw
+    _name_font = None
+    # Body sprites by (color, size, attacking), see _body_sprite()
+    _body_sprites = {}
+
     def get_attack_rect(self) -> pygame.Rect:
-        """Get attack hitbox using 8-direction logic based on direction_angle."""
-        attack_range = 40
-        attack_width = 30
-        angle = self.direction_angle % 360
-        
-        if angle < 22.5 or angle >= 337.5:
-            return pygame.Rect(
-                self.rect.right,
-                self.rect.centery - attack_width // 2,
-                attack_range,
-                attack_width,
-            )
-        elif 22.5 <= angle < 67.5:
-            return pygame.Rect(
-                self.rect.right - attack_width // 2,
-                self.rect.bottom - attack_width // 2,
-                attack_range,
-                attack_range,
-            )
-        elif 67.5 <= angle < 112.5:
-            return pygame.Rect(
-                self.rect.centerx - attack_width // 2,
-                self.rect.bottom,
-                attack_width,
-                attack_range,
-            )
-        elif 112.5 <= angle < 157.5:
-            return pygame.Rect(
-                self.rect.left - attack_range + attack_width // 2,
-                self.rect.bottom - attack_width // 2,
-                attack_range,
-                attack_range,
-            )
-        elif 157.5 <= angle < 202.5:
-            return pygame.Rect(
-                self.rect.left - attack_range,
-                self.rect.centery - attack_width // 2,
-                attack_range,
-                attack_width,
-            )
-        elif 202.5 <= angle < 247.5:
-            return pygame.Rect(
-                self.rect.left - attack_range + attack_width // 2,
-                self.rect.top - attack_range + attack_width // 2,
-                attack_range,
-                attack_range,
-            )
-        elif 247.5 <= angle < 292.5:
-            return pygame.Rect(
-                self.rect.centerx - attack_width // 2,
-                self.rect.top - attack_range,
-                attack_width,
-                attack_range,
-            )
-        else:
-            return pygame.Rect(
-                self.rect.right - attack_width // 2,
-                self.rect.top - attack_range + attack_width // 2,
-                attack_range,
-                attack_range,
-            )
+        """
+        Get attack hitbox using 8-direction logic based on direction_angle.
+        
+        Returns:
+            The enemy's own attack Rect, updated in place on each call; copy()
+            it to keep or modify it
+        """
+        return attack_rect_for(self.rect, self.direction_angle, self._attack_rect)
     
     def draw(self, surface: pygame.Surface):
         """
@@ -364,19 +416,60 @@ class Enemy:
         Args:
             surface: Pygame surface to draw on
         """
-        # Draw enemy (colored square based on type)
-        pygame.draw.rect(surface, self.color, self.rect)
+        # Draw enemy (colored square based on type) with its border
+        surface.blit(self._body_sprite(self.color, self.size, self.is_attacking), self.rect)
+        
+        # Direction indicator and health bar
+        self._draw_overlay(surface, self.rect)
+        
+        # Floating name above enemy
+        name_surf = self._name_surface()
+        surface.blit(name_surf, name_surf.get_rect(center=(self.rect.centerx, self.rect.y - 18)))
+        
+        # Draw attack range indicator when attacking (debug)
+        if self.is_attacking:
+            attack_rect = self.get_attack_rect()
+            pygame.draw.rect(surface, (255, 100, 100), attack_rect, 1)
+
+    @classmethod
+    def _body_sprite(cls, color: Tuple[int, int, int], size: int, attacking: bool) -> pygame.Surface:
+        """
+        Get the enemy body (filled square plus border), prerendered once per look.
         
-        # Draw border
-        border_color = WHITE if not self.is_attacking else RED
-        pygame.draw.rect(surface, border_color, self.rect, 2)
+        Args:
+            color: Body color
+            size: Square side length
+            attacking: Red border instead of white
+            
+        Returns:
+            Cached sprite surface
+        """
+        key = (color, size, attacking)
+        sprite = cls._body_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size, size))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            sprite.fill(color)
+            pygame.draw.rect(sprite, RED if attacking else WHITE, sprite.get_rect(), 2)
+            cls._body_sprites[key] = sprite
+        return sprite
+
+    def _draw_overlay(self, surface: pygame.Surface, rect: pygame.Rect):
+        """
+        Draw the direction indicator and health bar.
         
+        Args:
+            surface: Pygame surface to draw on
+            rect: Where the enemy is on that surface
+        """
         # Draw direction indicator using direction_angle
-        center_x, center_y = self.rect.center
+        center_x, center_y = rect.center
         indicator_length = 12
+        i = dir_index(self.direction_angle)
         end_pos = (
-            int(center_x + math.cos(math.radians(self.direction_angle)) * indicator_length),
-            int(center_y + math.sin(math.radians(self.direction_angle)) * indicator_length),
+            int(center_x + DIR_COS[i] * indicator_length),
+            int(center_y + DIR_SIN[i] * indicator_length),
         )
         
         pygame.draw.line(surface, BLACK, (center_x, center_y), end_pos, 2)
@@ -384,8 +477,8 @@ class Enemy:
         # Draw health bar above enemy
         health_bar_width = self.size
         health_bar_height = 4
-        health_bar_x = self.rect.x
-        health_bar_y = self.rect.y - 8
+        health_bar_x = rect.x
+        health_bar_y = rect.y - 8
         
         # Background (red)
         pygame.draw.rect(surface, RED,
@@ -397,17 +490,15 @@ class Enemy:
         health_color = (50, 200, 50)  # Green
         pygame.draw.rect(surface, health_color,
                         (health_bar_x, health_bar_y, current_health_width, health_bar_height))
-        
-        # Floating name above enemy
-        font = pygame.font.Font(None, 20)
-        name_text = font.render(self.name, True, WHITE)
-        name_rect = name_text.get_rect(center=(self.rect.centerx, self.rect.y - 18))
-        surface.blit(name_text, name_rect)
-        
-        # Draw attack range indicator when attacking (debug)
-        if self.is_attacking:
-            attack_rect = self.get_attack_rect()
-            pygame.draw.rect(surface, (255, 100, 100), attack_rect, 1)
+
+    def _name_surface(self) -> pygame.Surface:
+        """Get the rendered name label, re-rendering only when the name has changed."""
+        if self._name_label != self.name:
+            if Enemy._name_font is None:
+                Enemy._name_font = pygame.font.Font(None, 20)
+            self._name_surf = Enemy._name_font.render(self.name, True, WHITE)
+            self._name_label = self.name
+        return self._name_surf
     
     def set_patrol_points(self, points: list):
         """
@@ -437,7 +528,7 @@ class Enemy:
             drops.append({
                 'type': 'health_potion',
                 'value': 20,
-                'position': tuple(self.position)
+                'position': (self.pos_x, self.pos_y)
             })
         
         return drops
@@ -445,4 +536,4 @@ class Enemy:
     def __str__(self):
         return (f"{self.name} ({self.enemy_type.value}): "
                 f"Health={self.health}/{self.max_health}, "
-                f"Damage={self.damage}, Position={tuple(self.position)}")
\ No newline at end of file
+                f"Damage={self.damage}, Position={(self.pos_x, self.pos_y)}")
\ No newline at end of file
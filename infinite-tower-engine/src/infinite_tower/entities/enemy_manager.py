@@ -0,0 +1,250 @@
+"""
+Infinite Tower Engine - Enemy Batch Update Module
+
+Copyright (c) 2025 CosmicPhoenix171. All Rights Reserved.
+"""
+
+import numpy as np
+import pygame
+from typing import Optional, List
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, BATCH_ENEMY_UPDATE_MIN, PARALLEL_ENEMY_UPDATE_MIN
+from ..systems.physics import Physics
+from .facing import DIR_COS, DIR_SIN
+
+# Array copies of the facing direction LUT
+_DIR_COS_ARR = np.array(DIR_COS, dtype=np.float64)
+_DIR_SIN_ARR = np.array(DIR_SIN, dtype=np.float64)
+
+# Optional JIT for the turn/move/clamp step; the NumPy path is used without it
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    def _step_enemies_impl(angle, desired, rot, speed, intent, half, pos_x, pos_y, vel_x, vel_y,
+                           dir_cos, dir_sin, dt, min_x, min_y, max_x, max_y):
+        """Enemy._integrate for every enemy, fused into one loop; arrays are updated in place."""
+        # Iterations are independent; prange is a plain range unless compiled with parallel=True
+        for i in prange(angle.shape[0]):
+            # Rotate toward desired angle (shortest arc)
+            diff = (desired[i] - angle[i] + 540.0) % 360.0 - 180.0
+            if diff > 0:
+                a = angle[i] + min(rot[i], diff)
+            else:
+                a = angle[i] + max(-rot[i], diff)
+            a %= 360.0
+            angle[i] = a
+
+            if intent[i] != 0:
+                d = int(a + 0.5) % 360
+                vel_x[i] = dir_cos[d] * speed[i] * intent[i]
+                vel_y[i] = dir_sin[d] * speed[i] * intent[i]
+            else:
+                vel_x[i] = 0.0
+                vel_y[i] = 0.0
+
+            x = pos_x[i] + vel_x[i] * dt
+            y = pos_y[i] + vel_y[i] * dt
+            pos_x[i] = max(min_x + half[i], min(x, max_x - half[i]))
+            pos_y[i] = max(min_y + half[i], min(y, max_y - half[i]))
+
+    _step_enemies = njit(cache=True, nogil=True)(_step_enemies_impl)
+    # Spread over cores for very large groups (see PARALLEL_ENEMY_UPDATE_MIN)
+    _step_enemies_parallel = njit(cache=True, nogil=True, parallel=True)(_step_enemies_impl)
+
+
+class EnemyManager:
+    """
+    Updates a group of enemies, batching their movement with NumPy (or a
+    Numba kernel when numba is installed).
+
+    AI and wall resolution stay per enemy. The turn/move/clamp step in
+    between is run for all enemies at once on Structure-of-Arrays copies of
+    their state, gathered each frame and written back afterwards, followed
+    by one enemies x walls overlap test so only enemies actually touching a
+    wall go through the per-wall resolver.
+    """
+
+    def __init__(self, batch_min: int = BATCH_ENEMY_UPDATE_MIN):
+        """
+        Args:
+            batch_min: Enemy count from which the batched path is used; below
+                it, gathering the arrays costs more than it saves
+        """
+        self.batch_min = batch_min
+        # (obstacle list, its length, packed wall rects) for the wall broadphase
+        self._wall_cache = (None, 0, None)
+        if _NUMBA_AVAILABLE:
+            # Compile (or load from cache) the kernel now instead of stalling
+            # the first frame that crosses batch_min
+            self._integrate_all([], 1.0, None)
+
+    def update_all(self, enemies: List, player, dt: float = 1.0,
+                   obstacles: Optional[list] = None, bounds: Optional[tuple] = None):
+        """
+        Update every living enemy for one frame.
+
+        Args:
+            enemies: Enemies to update (dead ones are skipped)
+            player: Player entity
+            dt: Delta time
+            obstacles: List of obstacle rects
+            bounds: (min_x, min_y, max_x, max_y) world bounds, or None for the screen
+        """
+        alive = [enemy for enemy in enemies if enemy.is_alive()]
+        if len(alive) < self.batch_min:
+            for enemy in alive:
+                enemy.update(player, dt, obstacles=obstacles, bounds=bounds)
+            return
+
+        # AI only reads the enemy itself and the player, so running all of it
+        # first is equivalent to interleaving it with the movement
+        for enemy in alive:
+            enemy._think(player, obstacles)
+
+        # Leave out idle enemies whose last step was a no-op (see Enemy._rest_key)
+        stepping = []
+        rests = []
+        for enemy in alive:
+            rest = enemy._rest_key()
+            if rest is None or rest != enemy._rest:
+                stepping.append(enemy)
+                rests.append(rest)
+        if not stepping:
+            return
+
+        pos_x, pos_y = self._integrate_all(stepping, dt, bounds)
+
+        if obstacles:
+            touching = self._touching_walls(stepping, pos_x, pos_y, self._wall_array(obstacles)).tolist()
+            for enemy, resolve in zip(stepping, touching):
+                enemy._settle(obstacles, resolve)
+        else:
+            for enemy in stepping:
+                enemy._settle(obstacles)
+
+        for enemy, rest in zip(stepping, rests):
+            enemy._note_rest(rest)
+
+    def draw_all(self, surface: pygame.Surface, enemies: List, offset: tuple = (0, 0)):
+        """
+        Draw enemies, batching the body sprites and name labels into blits() calls.
+        
+        Each enemy looks as it does with Enemy.draw; where enemies overlap,
+        they are layered per pass (bodies, then bars, labels and attack
+        indicators) rather than one enemy at a time.
+        
+        Args:
+            surface: Surface to draw on
+            enemies: Enemies to draw (culling is up to the caller)
+            offset: (x, y) added to each enemy's rect to get its position on surface
+        """
+        ox, oy = offset
+        rects = [enemy.rect.move(ox, oy) for enemy in enemies]
+        surface.blits([(enemy._body_sprite(enemy.color, enemy.size, enemy.is_attacking), rect)
+                       for enemy, rect in zip(enemies, rects)], doreturn=False)
+
+        labels = []
+        for enemy, rect in zip(enemies, rects):
+            enemy._draw_overlay(surface, rect)
+            name_surf = enemy._name_surface()
+            labels.append((name_surf, name_surf.get_rect(center=(rect.centerx, rect.y - 18))))
+        surface.blits(labels, doreturn=False)
+
+        # Attack range indicator when attacking (debug)
+        for enemy in enemies:
+            if enemy.is_attacking:
+                pygame.draw.rect(surface, (255, 100, 100), enemy.get_attack_rect().move(ox, oy), 1)
+
+    def _wall_array(self, obstacles: list) -> np.ndarray:
+        """Return obstacle rects packed by Physics.rects_to_array, rebuilt only when the list changes."""
+        cached, count, array = self._wall_cache
+        if cached is not obstacles or count != len(obstacles):
+            rects = [getattr(obj, 'rect', obj) for obj in obstacles]
+            array = Physics.rects_to_array([r for r in rects if isinstance(r, pygame.Rect)])
+            self._wall_cache = (obstacles, len(obstacles), array)
+        return array
+
+    @staticmethod
+    def _touching_walls(enemies: List, pos_x: np.ndarray, pos_y: np.ndarray,
+                        walls: np.ndarray) -> np.ndarray:
+        """
+        Broadphase for wall resolution.
+        
+        Args:
+            enemies: Enemies, in the same order as the position arrays
+            pos_x: Enemy x positions after integration
+            pos_y: Enemy y positions after integration
+            walls: (M, 4) array of (left, top, right, bottom) rows
+            
+        Returns:
+            Boolean mask, True for enemies whose rect (as _settle will sync it)
+            overlaps at least one wall
+        """
+        size = np.array([enemy.size for enemy in enemies], dtype=np.float64)
+        half = size // 2
+        left = np.trunc(pos_x - half)[:, None]
+        top = np.trunc(pos_y - half)[:, None]
+        right = left + size[:, None]
+        bottom = top + size[:, None]
+        overlap = ((walls[:, 0] < right) & (walls[:, 2] > left) &
+                   (walls[:, 1] < bottom) & (walls[:, 3] > top))
+        return overlap.any(axis=1)
+
+    @staticmethod
+    def _integrate_all(enemies: List, dt: float, bounds: Optional[tuple]):
+        """Vectorized Enemy._integrate over all enemies; returns the new (x, y) position arrays."""
+        angle = np.array([enemy.direction_angle for enemy in enemies], dtype=np.float64)
+        desired = np.array([enemy._desired_angle for enemy in enemies], dtype=np.float64)
+        rot = np.array([enemy.rotation_speed for enemy in enemies], dtype=np.float64)
+        speed = np.array([enemy.speed for enemy in enemies], dtype=np.float64)
+        intent = np.array([enemy._move_intent for enemy in enemies], dtype=np.float64)
+        half = np.array([enemy._half_size for enemy in enemies], dtype=np.float64)
+        pos_x = np.array([enemy.pos_x for enemy in enemies], dtype=np.float64)
+        pos_y = np.array([enemy.pos_y for enemy in enemies], dtype=np.float64)
+
+        if bounds:
+            min_x, min_y, max_x, max_y = bounds
+        else:
+            min_x, min_y, max_x, max_y = 0, 0, SCREEN_WIDTH, SCREEN_HEIGHT
+
+        if _NUMBA_AVAILABLE:
+            vel_x = np.empty_like(pos_x)
+            vel_y = np.empty_like(pos_y)
+            step = _step_enemies_parallel if len(enemies) >= PARALLEL_ENEMY_UPDATE_MIN else _step_enemies
+            step(angle, desired, rot, speed, intent, half, pos_x, pos_y, vel_x, vel_y,
+                 _DIR_COS_ARR, _DIR_SIN_ARR, float(dt),
+                 float(min_x), float(min_y), float(max_x), float(max_y))
+        else:
+            # Rotate toward desired angle (shortest arc)
+            diff = np.mod(desired - angle + 540, 360) - 180
+            angle = np.mod(angle + np.clip(diff, -rot, rot), 360)
+
+            # Velocity along the facing; idle enemies stop
+            d = (angle + 0.5).astype(np.intp) % 360
+            moving = intent != 0
+            vel_x = np.where(moving, _DIR_COS_ARR[d] * speed * intent, 0.0)
+            vel_y = np.where(moving, _DIR_SIN_ARR[d] * speed * intent, 0.0)
+
+            # Apply movement, then keep within bounds (world bounds preferred);
+            # in place, so the clamp doesn't allocate a new array per step
+            step = np.multiply(vel_x, dt)
+            pos_x += step
+            np.multiply(vel_y, dt, out=step)
+            pos_y += step
+            np.minimum(pos_x, max_x - half, out=pos_x)
+            np.maximum(pos_x, min_x + half, out=pos_x)
+            np.minimum(pos_y, max_y - half, out=pos_y)
+            np.maximum(pos_y, min_y + half, out=pos_y)
+
+        for enemy, a, vx, vy, px, py in zip(enemies, angle.tolist(), vel_x.tolist(), vel_y.tolist(),
+                                            pos_x.tolist(), pos_y.tolist()):
+            enemy.direction_angle = a
+            enemy.vel_x = vx
+            enemy.vel_y = vy
+            enemy.pos_x = px
+            enemy.pos_y = py
+        return pos_x, pos_y
@@ -0,0 +1,60 @@
+"""
+Infinite Tower Engine - Entity Facing Module
+
+Copyright (c) 2025 CosmicPhoenix171. All Rights Reserved.
+"""
+
+import math
+import pygame
+
+# Unit vector for each whole degree of facing (0 = right, clockwise), indexed
+# by dir_index(angle); shared by the player and enemies
+DIR_COS = tuple(math.cos(math.radians(i)) for i in range(360))
+DIR_SIN = tuple(math.sin(math.radians(i)) for i in range(360))
+
+
+def dir_index(angle: float) -> int:
+    """LUT index for a facing in degrees, rounded to the nearest degree."""
+    return int(angle % 360 + 0.5) % 360
+
+
+def sector_index(angle: float) -> int:
+    """45° sector of a facing in degrees: 0 = right, 1 = down-right, ... 7 = up-right."""
+    return int((angle % 360 + 22.5) // 45) & 7
+
+
+# How far an attack hitbox can reach past its owner's rect on any side, and its width
+ATTACK_RANGE = 40
+ATTACK_WIDTH = 30
+
+# Attack hitbox per sector_index(): (x anchor, x offset, y anchor, y offset,
+# width, height), where anchor 0/1/2 picks the rect's left/center/right
+# (or top/center/bottom) edge
+_ATTACK_SECTORS = (
+    (2, 0, 1, -(ATTACK_WIDTH // 2), ATTACK_RANGE, ATTACK_WIDTH),
+    (2, -(ATTACK_WIDTH // 2), 2, -(ATTACK_WIDTH // 2), ATTACK_RANGE, ATTACK_RANGE),
+    (1, -(ATTACK_WIDTH // 2), 2, 0, ATTACK_WIDTH, ATTACK_RANGE),
+    (0, ATTACK_WIDTH // 2 - ATTACK_RANGE, 2, -(ATTACK_WIDTH // 2), ATTACK_RANGE, ATTACK_RANGE),
+    (0, -ATTACK_RANGE, 1, -(ATTACK_WIDTH // 2), ATTACK_RANGE, ATTACK_WIDTH),
+    (0, ATTACK_WIDTH // 2 - ATTACK_RANGE, 0, ATTACK_WIDTH // 2 - ATTACK_RANGE, ATTACK_RANGE, ATTACK_RANGE),
+    (1, -(ATTACK_WIDTH // 2), 0, -ATTACK_RANGE, ATTACK_WIDTH, ATTACK_RANGE),
+    (2, -(ATTACK_WIDTH // 2), 0, ATTACK_WIDTH // 2 - ATTACK_RANGE, ATTACK_RANGE, ATTACK_RANGE),
+)
+
+
+def attack_rect_for(rect: pygame.Rect, angle: float, out: pygame.Rect) -> pygame.Rect:
+    """
+    Place the 8-direction attack hitbox of an entity.
+    
+    Args:
+        rect: The attacking entity's rect
+        angle: Its facing in degrees
+        out: Rect to write the hitbox into
+        
+    Returns:
+        out
+    """
+    xa, dx, ya, dy, w, h = _ATTACK_SECTORS[sector_index(angle)]
+    out.update((rect.left, rect.centerx, rect.right)[xa] + dx,
+               (rect.top, rect.centery, rect.bottom)[ya] + dy, w, h)
+    return out
@@ -9,8 +9,17 @@ import os
 from typing import Tuple, List, Optional
 from ..config import (
     PLAYER_HEALTH, PLAYER_SPEED, SCREEN_WIDTH, SCREEN_HEIGHT,
-    GREEN, WHITE, RED, SPRITES_PATH
+    GREEN, WHITE, RED, SPRITES_PATH, DEBUG_MODE
 )
+from .facing import DIR_COS, DIR_SIN, dir_index, sector_index, attack_rect_for
+
+# Movement keys, bound once so handle_input skips the pygame attribute lookups
+_K_W, _K_S, _K_A, _K_D = pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d
+_K_UP, _K_DOWN, _K_LEFT, _K_RIGHT = pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT
+_K_LSHIFT, _K_RSHIFT = pygame.K_LSHIFT, pygame.K_RSHIFT
+
+# Facing name per sector_index() of direction_angle
+_DIRS = ("right", "down-right", "down", "down-left", "left", "up-left", "up", "up-right")
 
 
 class Player:
@@ -30,6 +39,20 @@ class Player:
         defense: Damage reduction
         rect: Pygame rect for collision detection
     """
+
+    # Fixed attribute layout; the last group is progression state that Game
+    # assigns on new game (plus its attack bookkeeping flag)
+    __slots__ = (
+        'name', 'max_health', 'health', 'position', 'velocity', '_speed',
+        '_sprint_multiplier', '_sprint_speed', 'is_sprinting', 'size', 'inventory',
+        'sprite_sheet', 'sprite_frames', 'frame_width', 'frame_height',
+        'current_frame', 'animation_timer', 'animation_speed',
+        'stamina', 'max_stamina', 'attack_power', 'defense', 'is_attacking',
+        'attack_cooldown', 'attack_cooldown_time', 'direction', 'direction_angle',
+        'is_moving', 'rect',
+        'level', 'exp', 'max_exp', 'mana', 'max_mana', 'equipment', '_attack_processed',
+        '_attack_rect', '_attack_rect_key',
+    )
     
     def __init__(self, name: str, health: int = None, position: Tuple[float, float] = None):
         self.name = name
@@ -37,8 +60,9 @@ class Player:
         self.health = self.max_health
         self.position = list(position) if position else [SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2]
         self.velocity = [0.0, 0.0]
-        self.speed = PLAYER_SPEED
-        self.sprint_multiplier = 3.5  # Sprint is 3.5x normal speed
+        self._speed = PLAYER_SPEED
+        self._sprint_multiplier = 3.5  # Sprint is 3.5x normal speed
+        self._sprint_speed = self._speed * self._sprint_multiplier  # Kept in sync by the setters
         self.is_sprinting = False
         self.size = 48  # Player sprite size (increased from 32 for better visibility with zoom)
         self.inventory = []
@@ -76,7 +100,30 @@ class Player:
             self.size,
             self.size
         )
+        # Reused get_attack_rect() result and the (angle, x, y) it was built for
+        self._attack_rect = pygame.Rect(0, 0, 0, 0)
+        self._attack_rect_key = None
     
+    @property
+    def speed(self) -> float:
+        """Walking speed; setting it also updates the sprint speed."""
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float):
+        self._speed = value
+        self._sprint_speed = value * self._sprint_multiplier
+
+    @property
+    def sprint_multiplier(self) -> float:
+        """Sprint speed as a multiple of speed; setting it also updates the sprint speed."""
+        return self._sprint_multiplier
+
+    @sprint_multiplier.setter
+    def sprint_multiplier(self, value: float):
+        self._sprint_multiplier = value
+        self._sprint_speed = self._speed * value
+
     def _load_sprites(self):
         """Load and split the player sprite sheet into individual frames."""
         try:
@@ -86,12 +133,14 @@ class Player:
             engine_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
             sprite_path = os.path.join(engine_root, "assets", "sprites", "player_spritesheet.png")
             
-            print(f"[DEBUG] Looking for sprite at: {sprite_path}")
-            print(f"[DEBUG] File exists: {os.path.exists(sprite_path)}")
+            if DEBUG_MODE:
+                print(f"[DEBUG] Looking for sprite at: {sprite_path}")
+                print(f"[DEBUG] File exists: {os.path.exists(sprite_path)}")
             
             if os.path.exists(sprite_path):
                 self.sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-                print(f"[DEBUG] Sprite sheet loaded, size: {self.sprite_sheet.get_size()}")
+                if DEBUG_MODE:
+                    print(f"[DEBUG] Sprite sheet loaded, size: {self.sprite_sheet.get_size()}")
                 
                 # Extract 4 frames from 2x2 grid
                 # Top row (y=0): idle1 (x=0), idle2 (x=268)
@@ -107,15 +156,17 @@ class Player:
                     frame = self.sprite_sheet.subsurface(
                         pygame.Rect(x, y, self.frame_width, self.frame_height)
                     )
-                    # Scale to match player size
-                    scaled_frame = pygame.transform.scale(frame, (self.size, self.size))
+                    # Scale to match player size, converted once to the display format
+                    scaled_frame = pygame.transform.scale(frame, (self.size, self.size)).convert_alpha()
                     self.sprite_frames.append(scaled_frame)
-                print(f"[DEBUG] Loaded {len(self.sprite_frames)} sprite frames")
-            else:
+                if DEBUG_MODE:
+                    print(f"[DEBUG] Loaded {len(self.sprite_frames)} sprite frames")
+            elif DEBUG_MODE:
                 print(f"[DEBUG] Sprite file not found at {sprite_path}")
         except (pygame.error, FileNotFoundError) as e:
             # Sprite sheet not found or invalid, will use fallback rendering
-            print(f"[DEBUG] Error loading sprite: {e}")
+            if DEBUG_MODE:
+                print(f"[DEBUG] Error loading sprite: {e}")
             self.sprite_frames = []
 
     def handle_input(self, input_handler):
@@ -125,27 +176,24 @@ class Player:
         Args:
             input_handler: InputHandler instance for checking key states
         """
-        import math
-        
-        self.velocity = [0.0, 0.0]
+
+        velocity = self.velocity
+        velocity[0] = 0.0
+        velocity[1] = 0.0
         self.is_moving = False
         
+        # Read every key from one keyboard snapshot
+        keys = input_handler.get_keystate()
+        
         # Check if sprinting (Shift key) - only if stamina available
-        player_stamina = getattr(self, 'stamina', 100)
-        self.is_sprinting = ((input_handler.get_key(pygame.K_LSHIFT) or 
-                             input_handler.get_key(pygame.K_RSHIFT)) and 
-                            player_stamina > 0)
+        self.is_sprinting = (keys[_K_LSHIFT] or keys[_K_RSHIFT]) and self.stamina > 0
         
         # Apply sprint multiplier
-        current_speed = self.speed * self.sprint_multiplier if self.is_sprinting else self.speed
-        
-        # Get current facing angle (default to 0 if never set)
-        if not hasattr(self, 'direction_angle'):
-            self.direction_angle = 0
+        current_speed = self._sprint_speed if self.is_sprinting else self._speed
         
         # Determine forward/backward first so we can flip rotation when moving backward
-        is_forward = (input_handler.get_key(pygame.K_w) or input_handler.get_key(pygame.K_UP))
-        is_backward = (input_handler.get_key(pygame.K_s) or input_handler.get_key(pygame.K_DOWN))
+        is_forward = keys[_K_W] or keys[_K_UP]
+        is_backward = keys[_K_S] or keys[_K_DOWN]
         forward_tmp = 1 if is_forward else (-1 if is_backward else 0)
 
         # ROTATION INPUT: A/Left = Rotate Left, D/Right = Rotate Right
@@ -153,47 +201,28 @@ class Player:
         rotation_speed = 5  # degrees per frame
         rot_sign = -1 if forward_tmp == -1 else 1
         
-        if input_handler.get_key(pygame.K_a) or input_handler.get_key(pygame.K_LEFT):
+        if keys[_K_A] or keys[_K_LEFT]:
             self.direction_angle -= rotation_speed * rot_sign
-        if input_handler.get_key(pygame.K_d) or input_handler.get_key(pygame.K_RIGHT):
+        if keys[_K_D] or keys[_K_RIGHT]:
             self.direction_angle += rotation_speed * rot_sign
         
         # Keep angle in 0-360 range
         self.direction_angle = self.direction_angle % 360
         
         # Update cardinal direction based on angle (for visual facing)
-        angle = self.direction_angle
-        if angle < 22.5 or angle >= 337.5:
-            self.direction = "right"
-        elif 22.5 <= angle < 67.5:
-            self.direction = "down-right"
-        elif 67.5 <= angle < 112.5:
-            self.direction = "down"
-        elif 112.5 <= angle < 157.5:
-            self.direction = "down-left"
-        elif 157.5 <= angle < 202.5:
-            self.direction = "left"
-        elif 202.5 <= angle < 247.5:
-            self.direction = "up-left"
-        elif 247.5 <= angle < 292.5:
-            self.direction = "up"
-        else:  # 292.5 <= angle < 337.5
-            self.direction = "up-right"
+        self.direction = _DIRS[sector_index(self.direction_angle)]
         
         # MOVEMENT INPUT: W/Up = Forward, S/Down = Backward
         forward = forward_tmp
         
         # Calculate velocity based on facing angle and forward input
         if forward != 0:
-            angle_rad = math.radians(self.direction_angle)
+            i = dir_index(self.direction_angle)
             
             # Move in direction player is facing (or opposite if backward)
-            self.velocity[0] = math.cos(angle_rad) * forward * current_speed
-            self.velocity[1] = math.sin(angle_rad) * forward * current_speed
+            velocity[0] = DIR_COS[i] * forward * current_speed
+            velocity[1] = DIR_SIN[i] * forward * current_speed
             self.is_moving = True
-        else:
-            self.velocity = [0.0, 0.0]
-            self.is_moving = False
         
         # Attack input (Left Mouse Button). get_mouse_button(0) == left in pygame.get_pressed()
         if input_handler.get_mouse_button(0) and self.attack_cooldown == 0:
@@ -211,25 +240,25 @@ class Player:
         # Update sprite animation
         self._update_animation()
         
+        # position/velocity are lists, so updating them through locals writes through
+        position = self.position
+        velocity = self.velocity
+        half_size = self.size // 2
+        
         # Update position
-        self.position[0] += self.velocity[0] * dt
-        self.position[1] += self.velocity[1] * dt
+        position[0] += velocity[0] * dt
+        position[1] += velocity[1] * dt
         
-        # Apply boundary constraints
+        # Apply boundary constraints (default to the screen)
         if bounds:
             min_x, min_y, max_x, max_y = bounds
-            half_size = self.size // 2
-            self.position[0] = max(min_x + half_size, min(self.position[0], max_x - half_size))
-            self.position[1] = max(min_y + half_size, min(self.position[1], max_y - half_size))
         else:
-            # Default screen boundaries
-            half_size = self.size // 2
-            self.position[0] = max(half_size, min(self.position[0], SCREEN_WIDTH - half_size))
-            self.position[1] = max(half_size, min(self.position[1], SCREEN_HEIGHT - half_size))
+            min_x, min_y, max_x, max_y = 0, 0, SCREEN_WIDTH, SCREEN_HEIGHT
+        position[0] = max(min_x + half_size, min(position[0], max_x - half_size))
+        position[1] = max(min_y + half_size, min(position[1], max_y - half_size))
         
         # Update collision rect
-        self.rect.x = int(self.position[0] - self.size // 2)
-        self.rect.y = int(self.position[1] - self.size // 2)
+        self.rect.topleft = (int(position[0] - half_size), int(position[1] - half_size))
         
         # Update attack cooldown
         if self.attack_cooldown > 0:
@@ -241,21 +270,30 @@ class Player:
         """
         Legacy move method for backward compatibility.
         
+        Only moves the player (kept on screen) and syncs the rect; unlike
+        update() it doesn't apply velocity or tick animation and cooldowns,
+        which the frame update already does.
+        
         Args:
             direction: 'up', 'down', 'left', or 'right'
             dt: Delta time multiplier
         """
+        position = self.position
+        step = self._speed * dt
         if direction == 'up':
-            self.position[1] -= self.speed * dt
+            position[1] -= step
         elif direction == 'down':
-            self.position[1] += self.speed * dt
+            position[1] += step
         elif direction == 'left':
-            self.position[0] -= self.speed * dt
+            position[0] -= step
         elif direction == 'right':
-            self.position[0] += self.speed * dt
+            position[0] += step
         
         self.direction = direction
-        self.update(dt)
+        half_size = self.size // 2
+        position[0] = max(half_size, min(position[0], SCREEN_WIDTH - half_size))
+        position[1] = max(half_size, min(position[1], SCREEN_HEIGHT - half_size))
+        self.rect.topleft = (int(position[0] - half_size), int(position[1] - half_size))
 
     def take_damage(self, amount: int) -> bool:
         """
@@ -290,6 +328,15 @@ class Player:
             item: Item object to add
         """
         self.inventory.append(item)
+    
+    def extend_inventory(self, items):
+        """
+        Add several items to the player's inventory in one pass.
+        
+        Args:
+            items: Iterable of item objects to add
+        """
+        self.inventory.extend(items)
         
     def remove_from_inventory(self, item):
         """
@@ -310,87 +357,18 @@ class Player:
         Get the attack hitbox based on current direction (8 directions).
         
         Returns:
-            Pygame Rect representing the attack range
+            Pygame Rect representing the attack range. The same Rect is reused
+            between calls; copy() it to keep or modify it
         """
-        import math
-        
-        attack_range = 40
-        attack_width = 30
-        
-        # Use direction_angle if available, otherwise use cardinal direction
-        angle = getattr(self, 'direction_angle', 0)
-        
-        # Normalize angle to 0-360
-        angle = angle % 360
-        
-        # Determine direction from angle (8 directions)
-        # Each direction covers 45 degrees
-        # 0° = right, 45° = down-right, 90° = down, etc.
-        
-        if angle < 22.5 or angle >= 337.5:
-            # Right (0°)
-            return pygame.Rect(
-                self.rect.right,
-                self.rect.centery - attack_width // 2,
-                attack_range,
-                attack_width
-            )
-        elif 22.5 <= angle < 67.5:
-            # Down-Right (45°)
-            return pygame.Rect(
-                self.rect.right - attack_width // 2,
-                self.rect.bottom - attack_width // 2,
-                attack_range,
-                attack_range
-            )
-        elif 67.5 <= angle < 112.5:
-            # Down (90°)
-            return pygame.Rect(
-                self.rect.centerx - attack_width // 2,
-                self.rect.bottom,
-                attack_width,
-                attack_range
-            )
-        elif 112.5 <= angle < 157.5:
-            # Down-Left (135°)
-            return pygame.Rect(
-                self.rect.left - attack_range + attack_width // 2,
-                self.rect.bottom - attack_width // 2,
-                attack_range,
-                attack_range
-            )
-        elif 157.5 <= angle < 202.5:
-            # Left (180°)
-            return pygame.Rect(
-                self.rect.left - attack_range,
-                self.rect.centery - attack_width // 2,
-                attack_range,
-                attack_width
-            )
-        elif 202.5 <= angle < 247.5:
-            # Up-Left (225°)
-            return pygame.Rect(
-                self.rect.left - attack_range + attack_width // 2,
-                self.rect.top - attack_range + attack_width // 2,
-                attack_range,
-                attack_range
-            )
-        elif 247.5 <= angle < 292.5:
-            # Up (270°)
-            return pygame.Rect(
-                self.rect.centerx - attack_width // 2,
-                self.rect.top - attack_range,
-                attack_width,
-                attack_range
-            )
-        else:  # 292.5 <= angle < 337.5
-            # Up-Right (315°)
-            return pygame.Rect(
-                self.rect.right - attack_width // 2,
-                self.rect.top - attack_range + attack_width // 2,
-                attack_range,
-                attack_range
-            )
+        # Combat and the renderer both ask for it each attacking frame; reuse it
+        # until the player turns or moves
+        rect = self.rect
+        key = (self.direction_angle, rect.x, rect.y)
+        if key == self._attack_rect_key:
+            return self._attack_rect
+
+        self._attack_rect_key = key
+        return attack_rect_for(rect, self.direction_angle, self._attack_rect)
 
     def _update_animation(self):
         """Update sprite animation frames."""
@@ -417,6 +395,40 @@ class Player:
                 else:  # current_frame == 1
                     self.current_frame = 0
 
+    # Fallback bodies by size, see _body_sprite()
+    _body_sprites = {}
+
+    @classmethod
+    def _body_sprite(cls, size: int) -> pygame.Surface:
+        """
+        Get the fallback body (square, upward triangle and center dot), prerendered once.
+        
+        Args:
+            size: Square side length
+            
+        Returns:
+            Cached sprite surface
+        """
+        sprite = cls._body_sprites.get(size)
+        if sprite is None:
+            sprite = pygame.Surface((size, size))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            sprite.fill(GREEN)
+            
+            # Triangle pointing upward (player's facing direction in screen space)
+            half_size = size // 2
+            points = [
+                (half_size, 0),  # Top point (forward)
+                (half_size - half_size // 2, half_size + half_size // 2),  # Bottom left
+                (half_size + half_size // 2, half_size + half_size // 2),  # Bottom right
+            ]
+            pygame.draw.polygon(sprite, (0, 200, 0), points)
+            pygame.draw.polygon(sprite, WHITE, points, 2)
+            pygame.draw.circle(sprite, WHITE, (half_size, half_size), 3)
+            cls._body_sprites[size] = sprite
+        return sprite
+
     def draw(self, surface: pygame.Surface):
         """
         Draw the player on the screen with sprite animation.
@@ -425,33 +437,17 @@ class Player:
         Args:
             surface: Pygame surface to draw on
         """
-        import math
-        
-        center_x, center_y = self.rect.center
-        
+
         # Draw sprite if loaded, otherwise fallback to colored shapes
         if self.sprite_frames:
             # Get current animation frame
             sprite = self.sprite_frames[self.current_frame]
             # Center the sprite on player position
-            sprite_rect = sprite.get_rect(center=(center_x, center_y))
+            sprite_rect = sprite.get_rect(center=self.rect.center)
             surface.blit(sprite, sprite_rect)
         else:
-            # Fallback: Draw player body (green square)
-            pygame.draw.rect(surface, GREEN, self.rect)
-            
-            # Draw a triangle pointing upward (player's facing direction in screen space)
-            half_size = self.size // 2
-            points = [
-                (center_x, center_y - half_size),  # Top point (forward)
-                (center_x - half_size // 2, center_y + half_size // 2),  # Bottom left
-                (center_x + half_size // 2, center_y + half_size // 2),  # Bottom right
-            ]
-            pygame.draw.polygon(surface, (0, 200, 0), points)
-            pygame.draw.polygon(surface, WHITE, points, 2)
-            
-            # Draw a small dot at center
-            pygame.draw.circle(surface, WHITE, (center_x, center_y), 3)
+            # Fallback: prerendered body (green square with direction triangle)
+            surface.blit(self._body_sprite(self.size), self.rect)
         
         # Note: attack hitbox visualization is drawn by the Game renderer on the world surface
         # so it aligns with world rotation. We don't draw it here to avoid mismatch.
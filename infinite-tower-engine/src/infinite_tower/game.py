@@ -1,5 +1,7 @@
 import pygame
 import logging
+import math
+import numpy as np
 from typing import Optional
 
 from .utils.input_handler import InputHandler
@@ -7,6 +9,8 @@ from .resources.loader import ResourceLoader
 from . import config
 from .entities.player import Player
 from .entities.enemy import Enemy, EnemyType
+from .entities.enemy_manager import EnemyManager
+from .entities.facing import ATTACK_RANGE
 from .entities.wall import Wall
 from .ui.game_ui import GameUI
 from .ui.inventory import InventoryUI
@@ -23,6 +27,15 @@ try:
 except Exception:
     _SDL2_AVAILABLE = False
 
+# Event types no handler reads. Blocking them at startup stops SDL from
+# queueing them and pygame from building event objects for them. Window
+# events stay allowed: VIDEORESIZE and SCALED scaling are driven by them.
+_UNHANDLED_EVENTS = [
+    pygame.MOUSEMOTION, pygame.TEXTINPUT, pygame.TEXTEDITING,
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.CONTROLLERAXISMOTION, pygame.FINGERMOTION, pygame.MULTIGESTURE,
+]
+
 
 class Game:
     def _init_pygame(self):
@@ -54,6 +67,9 @@ class Game:
                 pygame.display.set_caption(config.TITLE)
                 # UI overlay surface for consistency
                 self._ui_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+            # Keep high-frequency events nobody handles out of the queue entirely;
+            # the mouse position is polled once per frame instead
+            pygame.event.set_blocked(_UNHANDLED_EVENTS)
             self.logger.info("Pygame initialized successfully")
         except pygame.error as e:
             self.logger.error(f"Failed to initialize pygame: {e}")
@@ -96,6 +112,7 @@ class Game:
         self.inventory_ui: Optional[InventoryUI] = None
         self.combat_system: Optional[CombatSystem] = None
         self.physics: Optional[Physics] = None
+        self.enemy_manager: Optional[EnemyManager] = None
         self.loot_gen: Optional[LootGenerator] = None
         self.walls: list[Wall] = []
 
@@ -111,10 +128,26 @@ class Game:
         # World rendering caches (for rotating camera performance)
         self._world_bg = None           # Static background (floor + grid)
         self._world_surface = None      # Working surface for entities
+        self._walls_layer = None        # Prerendered walls for the current floor
+        self._wall_array = None         # Wall rects packed for batched collision tests
+        self._wall_rects: list[pygame.Rect] = []  # Plain wall rects for enemy collisions
+        self._walls_origin = (0, 0)     # World-space top-left of the walls layer
         self._world_size = 0            # Cached size of world surfaces
         self._last_rotated = None       # Cache last rotated surface
         self._last_rotation_angle = None  # Cache angle of last rotation
 
+        # Menu rendering cache (rebuilt only when the screen size changes)
+        self._menu_bg = None            # Vertical gradient background
+        self._menu_bg_size = None       # (sw, sh) the gradient was built for
+        self._static_frame = None       # Key of the last menu/pause/game over frame drawn
+        self._pause_layout = None       # (size, panel_rect, buttons) for the pause menu
+        self._pause_panel = None        # Prepainted pause panel (fill + border)
+
+        # Fonts keyed by point size, and the last rendered FPS overlay
+        self._fonts: dict[int, pygame.font.Font] = {}
+        self._fps_value = None
+        self._fps_surface = None
+
         # Debug flags and UI
         self.debug_flags = {
             'show_fps': False,
@@ -129,6 +162,17 @@ class Game:
         self.settings_tab = 'sound'
         self.settings_temp = {}
 
+        # Event dispatch table (event.type -> handler); see handle_events
+        self._event_handlers = {
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.VIDEORESIZE: self._on_video_resize,
+            # Window contents may be lost while covered/minimized; see _on_window_exposed
+            pygame.VIDEOEXPOSE: self._on_window_exposed,
+            pygame.WINDOWEXPOSED: self._on_window_exposed,
+            pygame.WINDOWRESTORED: self._on_window_exposed,
+        }
+
     # Pygame already initialized above
 
     def start(self):
@@ -157,7 +201,7 @@ class Game:
         self.camera_y = self.player.position[1] - sh // 2
         
         # Debug camera calc
-        if not hasattr(self, '_camera_debug'):
+        if config.DEBUG_MODE and not hasattr(self, '_camera_debug'):
             print(f"[CAMERA DEBUG] sw={sw}, sh={sh}, player_pos={self.player.position}, camera=({self.camera_x}, {self.camera_y})")
             self._camera_debug = True
 
@@ -194,7 +238,19 @@ class Game:
 
     def handle_events(self):
         """Handle pygame events."""
-        for event in pygame.event.get():
+        handlers = self._event_handlers
+        if self.inventory_ui and self.inventory_ui.is_visible:
+            self.inventory_ui.update_hover()
+        events = pygame.event.get()
+        # A window drag produces a burst of VIDEORESIZE events; only the last one
+        # matters, so surfaces/caches are rebuilt once per frame at most
+        last_resize = None
+        for event in events:
+            if event.type == pygame.VIDEORESIZE:
+                last_resize = event
+        for event in events:
+            if event.type == pygame.VIDEORESIZE and event is not last_resize:
+                continue
             if event.type == pygame.QUIT:
                 self.end()
                 return
@@ -206,99 +262,118 @@ class Game:
             # Pass event to input handler (except when paused and clicking pause menu)
             self.input_handler.handle_event(event)
             
-            # Handle pause/resume (ESC key)
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.current_state == "playing":
-                        self.pause()
-                        # avoid processing this same event as 'paused' below
-                        continue
-                    elif self.current_state == "paused":
-                        self.resume()
-                        continue
-                # When paused, only allow Quit (Q) or Resume (ESC handled above)
-                if self.current_state == "paused":
-                    if event.key == pygame.K_q:
-                        self.end()
-                        return
-                    # ignore other keys while paused
-                    continue
-                elif event.key == pygame.K_TAB or event.key == pygame.K_i or event.key == pygame.K_o:
-                    if self.inventory_ui:
-                        self.inventory_ui.toggle()
-                elif event.key == pygame.K_RETURN:
-                    # Dismiss dialog if showing
-                    if self.game_ui and getattr(self.game_ui, 'current_dialog', None):
-                        self.game_ui.hide_dialog()
-            # Remove keyup-based toggling to ensure Tab is a true toggle (no press-and-hold behavior)
-            elif event.type == pygame.KEYUP:
-                pass
-            # Main menu mouse handling
-            if self.current_state == "menu":
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if hasattr(self, '_menu_start_rect') and self._menu_start_rect.collidepoint(event.pos):
-                        self._start_play()
-                        self.logger.info("Transitioning to gameplay")
-                        return
-                    if hasattr(self, '_menu_quit_rect') and self._menu_quit_rect.collidepoint(event.pos):
-                        self.end()
-                        self.logger.info("Quit from main menu")
-                        return
-            
-            # Pause menu mouse handling
-            if self.current_state == "paused":
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    # If in debug substate, handle debug toggles
-                    if self.pause_substate == 'debug':
-                        # Back button
-                        if hasattr(self, '_debug_back_rect') and self._debug_back_rect.collidepoint(event.pos):
-                            self.pause_substate = None
-                            return
-                        # Toggle flags
-                        for key, rect in self._debug_ui_rects.items():
-                            if rect.collidepoint(event.pos):
-                                self.debug_flags[key] = not self.debug_flags.get(key, False)
-                                return
-                    # Base pause menu buttons
-                    buttons = self._compute_pause_buttons()
-                    if buttons['resume'].collidepoint(event.pos):
-                        self.resume()
-                        return
-                    if buttons['debug'].collidepoint(event.pos):
-                        self.pause_substate = 'debug'
-                        return
-                    if buttons['quit'].collidepoint(event.pos):
-                        self.end()
-                        return
-                # Game over screen mouse handling
-                if self.current_state == "game_over":
-                    if hasattr(self, '_game_over_restart_rect'):
-                        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                            if self._game_over_restart_rect.collidepoint(event.pos):
-                                self._start_play()
-                                return
-                            if self._game_over_quit_rect.collidepoint(event.pos):
-                                self.end()
-                                return
-            if event.type == pygame.VIDEORESIZE:
-                if getattr(self, 'use_gpu', False) and getattr(self, 'window', None):
-                    # Resize SDL window and UI surface
-                    self.window.size = (event.w, event.h)
-                    self._ui_surface = pygame.Surface((event.w, event.h), pygame.SRCALPHA).convert_alpha()
-                    # Update UI surfaces
-                    if self.game_ui:
-                        self.game_ui.screen = self._ui_surface
-                    if self.inventory_ui:
-                        self.inventory_ui.screen = self._ui_surface
-                else:
-                    flags = pygame.SCALED | pygame.RESIZABLE
-                    self.screen = pygame.display.set_mode((event.w, event.h), flags)
-                    # Update UI surfaces
-                    if self.game_ui:
-                        self.game_ui.screen = self.screen
-                    if self.inventory_ui:
-                        self.inventory_ui.screen = self.screen
-                    self.inventory_ui.screen = self.screen
+            # Dispatch on event type; a handler returns True to stop processing this frame
+            handler = handlers.get(event.type)
+            if handler is not None and handler(event):
+                return
+
+    def _on_key_down(self, event) -> bool:
+        """Handle KEYDOWN: pause/resume, quit from pause, inventory and dialog keys."""
+        # Handle pause/resume (ESC key)
+        if event.key == pygame.K_ESCAPE:
+            if self.current_state == "playing":
+                self.pause()
+                # avoid processing this same event as 'paused' below
+                return False
+            elif self.current_state == "paused":
+                self.resume()
+                return False
+        # When paused, only allow Quit (Q) or Resume (ESC handled above)
+        if self.current_state == "paused":
+            if event.key == pygame.K_q:
+                self.end()
+                return True
+            # ignore other keys while paused
+            return False
+        elif event.key == pygame.K_TAB or event.key == pygame.K_i or event.key == pygame.K_o:
+            if self.inventory_ui:
+                self.inventory_ui.toggle()
+        elif event.key == pygame.K_RETURN:
+            # Dismiss dialog if showing
+            if self.game_ui and getattr(self.game_ui, 'current_dialog', None):
+                self.game_ui.hide_dialog()
+        return False
+
+    def _on_mouse_button_down(self, event) -> bool:
+        """Handle left clicks on the main menu, pause menu and game over screen."""
+        if event.button != 1:
+            return False
+
+        # Main menu mouse handling
+        if self.current_state == "menu":
+            if hasattr(self, '_menu_start_rect') and self._menu_start_rect.collidepoint(event.pos):
+                self._start_play()
+                self.logger.info("Transitioning to gameplay")
+                return True
+            if hasattr(self, '_menu_quit_rect') and self._menu_quit_rect.collidepoint(event.pos):
+                self.end()
+                self.logger.info("Quit from main menu")
+                return True
+
+        # Pause menu mouse handling
+        elif self.current_state == "paused":
+            # If in debug substate, handle debug toggles
+            if self.pause_substate == 'debug':
+                # Back button
+                if hasattr(self, '_debug_back_rect') and self._debug_back_rect.collidepoint(event.pos):
+                    self.pause_substate = None
+                    return True
+                # Toggle flags
+                for key, rect in self._debug_ui_rects.items():
+                    if rect.collidepoint(event.pos):
+                        self.debug_flags[key] = not self.debug_flags.get(key, False)
+                        return True
+            # Base pause menu buttons
+            buttons = self._compute_pause_buttons()
+            if buttons['resume'].collidepoint(event.pos):
+                self.resume()
+                return True
+            if buttons['debug'].collidepoint(event.pos):
+                self.pause_substate = 'debug'
+                return True
+            if buttons['quit'].collidepoint(event.pos):
+                self.end()
+                return True
+
+        # Game over screen mouse handling
+        elif self.current_state == "game_over":
+            if hasattr(self, '_game_over_restart_rect'):
+                if self._game_over_restart_rect.collidepoint(event.pos):
+                    self._start_play()
+                    return True
+                if self._game_over_quit_rect.collidepoint(event.pos):
+                    self.end()
+                    return True
+        return False
+
+    def _on_window_exposed(self, event) -> bool:
+        """Force the next static frame to redraw after the window was uncovered or restored."""
+        # Without a compositor the uncovered area is left damaged until repainted
+        self._static_frame = None
+        return False
+
+    def _on_video_resize(self, event) -> bool:
+        """Recreate the render target(s) for the new window size."""
+        # The new display surface starts blank; force the next static frame to redraw
+        self._static_frame = None
+        if getattr(self, 'use_gpu', False) and getattr(self, 'window', None):
+            # Resize SDL window and UI surface
+            self.window.size = (event.w, event.h)
+            self._ui_surface = pygame.Surface((event.w, event.h), pygame.SRCALPHA).convert_alpha()
+            # Update UI surfaces
+            if self.game_ui:
+                self.game_ui.screen = self._ui_surface
+            if self.inventory_ui:
+                self.inventory_ui.screen = self._ui_surface
+        else:
+            flags = pygame.SCALED | pygame.RESIZABLE
+            self.screen = pygame.display.set_mode((event.w, event.h), flags)
+            # Update UI surfaces
+            if self.game_ui:
+                self.game_ui.screen = self.screen
+            if self.inventory_ui:
+                self.inventory_ui.screen = self.screen
+        return False
 
     def update(self, dt: float = 0.0):
         """Update game state."""
@@ -334,6 +409,7 @@ class Game:
         # Systems
         self.combat_system = CombatSystem()
         self.physics = Physics()
+        self.enemy_manager = EnemyManager()
         self.loot_gen = LootGenerator(seed=12345)
         # Floor generator
         # Use a time-based seed for variability across runs
@@ -355,9 +431,7 @@ class Game:
         self.player.equipment = []
 
         # Starter loot
-        for _ in range(5):
-            item = self.loot_gen.generate_random_item(floor_level=1)
-            self.player.add_to_inventory(item)
+        self.player.extend_inventory(self.loot_gen.generate_batch(5, floor_level=1))
 
         # Enemies will be spawned by the floor generator per-room
         self.enemies = []
@@ -393,6 +467,8 @@ class Game:
 
         # Build Wall entities from room tiles by merging horizontal wall runs; skip DOOR tiles
         self.walls = []
+        self._walls_layer = None
+        self._wall_array = None
         for room in rooms:
             base_tx = room.x * 20
             base_ty = room.y * 20
@@ -461,6 +537,7 @@ class Game:
             self.walls.append(Wall(bx0, by0, thickness, by1 - by0))
             # Right
             self.walls.append(Wall(bx1 - thickness, by0, thickness, by1 - by0))
+        self._wall_rects = [wall.rect for wall in self.walls]
         
         # UI
         ui_target = self._ui_surface if getattr(self, 'use_gpu', False) else self.screen
@@ -490,22 +567,32 @@ class Game:
         # Allow player to move within world bounds (not clamped to screen)
         self.player.update(dt, bounds=self.world_bounds)
 
-        # Collide player with walls (AABB resolution based on minimal overlap)
+        # Collide player with walls (AABB resolution based on minimal overlap).
+        # Walls are tested in one batch; after resolving a hit, only the walls
+        # after it are re-tested, matching a sequential pass over the list.
         if self.walls:
-            for wall in self.walls:
-                if self.player.rect.colliderect(wall.rect):
-                    side = self.physics.get_collision_side(self.player.rect, wall.rect, tuple(self.player.velocity))
-                    if side == "left":
-                        self.player.rect.right = wall.rect.left
-                    elif side == "right":
-                        self.player.rect.left = wall.rect.right
-                    elif side == "top":
-                        self.player.rect.bottom = wall.rect.top
-                    elif side == "bottom":
-                        self.player.rect.top = wall.rect.bottom
-                    # Sync position back to center of rect
-                    self.player.position[0] = self.player.rect.centerx
-                    self.player.position[1] = self.player.rect.centery
+            if self._wall_array is None:
+                self._wall_array = self.physics.rects_to_array([wall.rect for wall in self.walls])
+            start = 0
+            while True:
+                hits = np.flatnonzero(self.physics.batch_aabb(self.player.rect, self._wall_array[start:]))
+                if hits.size == 0:
+                    break
+                index = start + int(hits[0])
+                wall = self.walls[index]
+                side = self.physics.get_collision_side(self.player.rect, wall.rect, tuple(self.player.velocity))
+                if side == "left":
+                    self.player.rect.right = wall.rect.left
+                elif side == "right":
+                    self.player.rect.left = wall.rect.right
+                elif side == "top":
+                    self.player.rect.bottom = wall.rect.top
+                elif side == "bottom":
+                    self.player.rect.top = wall.rect.bottom
+                # Sync position back to center of rect
+                self.player.position[0] = self.player.rect.centerx
+                self.player.position[1] = self.player.rect.centery
+                start = index + 1
         
         # Maintain minimum distance between player and enemies (prevent clipping)
         for enemy in self.enemies:
@@ -524,16 +611,29 @@ class Game:
                 push_x = (dx / current_distance) * push_distance
                 push_y = (dy / current_distance) * push_distance
                 
-                enemy.position[0] += push_x
-                enemy.position[1] += push_y
+                enemy.pos_x += push_x
+                enemy.pos_y += push_y
                 
                 # Update enemy rect after push
-                enemy.rect.x = int(enemy.position[0] - enemy.size // 2)
-                enemy.rect.y = int(enemy.position[1] - enemy.size // 2)
+                enemy.rect.x = int(enemy.pos_x - enemy.size // 2)
+                enemy.rect.y = int(enemy.pos_y - enemy.size // 2)
         
-        # Also prevent enemies from overlapping each other
-        for i, enemy1 in enumerate(self.enemies):
-            for enemy2 in self.enemies[i + 1:]:
+        # Also prevent enemies from overlapping each other. With many enemies, bucket
+        # them into the physics spatial grid so each one is only tested against its
+        # neighbours; for a few, testing every pair is cheaper than the grid.
+        enemies = self.enemies
+        use_grid = len(enemies) >= config.SPATIAL_QUERY_MIN_ENEMIES
+        if use_grid:
+            self.physics.update_spatial_grid(enemies)
+            order = {id(enemy): i for i, enemy in enumerate(enemies)}
+        for i, enemy1 in enumerate(enemies):
+            if use_grid:
+                # Pairs can only interact when their rects are within the 5px buffer
+                nearby = self.physics.get_nearby_entities(enemy1.rect.inflate(12, 12))
+                neighbours = [e for _, e in sorted((order[id(e)], e) for e in nearby if order[id(e)] > i)]
+            else:
+                neighbours = enemies[i + 1:]
+            for enemy2 in neighbours:
                 min_distance = (enemy1.size // 2) + (enemy2.size // 2) + 5
                 dx = enemy2.rect.centerx - enemy1.rect.centerx
                 dy = enemy2.rect.centery - enemy1.rect.centery
@@ -545,16 +645,16 @@ class Game:
                     push_x = (dx / current_distance) * push_distance
                     push_y = (dy / current_distance) * push_distance
                     
-                    enemy1.position[0] -= push_x
-                    enemy1.position[1] -= push_y
-                    enemy2.position[0] += push_x
-                    enemy2.position[1] += push_y
+                    enemy1.pos_x -= push_x
+                    enemy1.pos_y -= push_y
+                    enemy2.pos_x += push_x
+                    enemy2.pos_y += push_y
                     
                     # Update rects
-                    enemy1.rect.x = int(enemy1.position[0] - enemy1.size // 2)
-                    enemy1.rect.y = int(enemy1.position[1] - enemy1.size // 2)
-                    enemy2.rect.x = int(enemy2.position[0] - enemy2.size // 2)
-                    enemy2.rect.y = int(enemy2.position[1] - enemy2.size // 2)
+                    half1 = enemy1.size // 2
+                    half2 = enemy2.size // 2
+                    enemy1.rect.topleft = (int(enemy1.pos_x - half1), int(enemy1.pos_y - half1))
+                    enemy2.rect.topleft = (int(enemy2.pos_x - half2), int(enemy2.pos_y - half2))
         
         # Stamina regen/drain
         if getattr(self.player, 'is_sprinting', False) and getattr(self.player, 'is_moving', False):
@@ -562,59 +662,90 @@ class Game:
         else:
             self.player.stamina = min(self.player.max_stamina, self.player.stamina + 0.3)
         
-        # Enemies
-        for enemy in self.enemies[:]:
-            if enemy.is_alive():
-                enemy.update(self.player, dt, obstacles=self.walls, bounds=self.world_bounds)
-            else:
-                if enemy in self.enemies:
-                    self.enemies.remove(enemy)
-                    self.game_ui.add_notification(f"Defeated {enemy.name}!", self.game_ui.COLORS['text_green'])
-                    self.player.exp += 50
-                    if self.player.exp >= self.player.max_exp:
-                        self.player.level += 1
-                        self.player.exp = 0
-                        self.game_ui.add_notification(f"Level Up! Now Level {self.player.level}", self.game_ui.COLORS['text_yellow'])
+        # Bind what the per-enemy loops below use once, rather than per iteration
+        player = self.player
+        walls = self._wall_rects
+        bounds = self.world_bounds
+        ui = self.game_ui
+        text_red = ui.COLORS['text_red']
+        text_green = ui.COLORS['text_green']
+        text_yellow = ui.COLORS['text_yellow']
+        perform_attack = self.combat_system.perform_attack
+
+        # Enemies (update the living as a batch, then sweep out the dead once)
+        self.enemy_manager.update_all(self.enemies, player, dt, obstacles=walls, bounds=bounds)
+        any_dead = False
+        for enemy in self.enemies:
+            if not enemy.is_alive():
+                any_dead = True
+                ui.add_notification(f"Defeated {enemy.name}!", text_green)
+                player.exp += 50
+                if player.exp >= player.max_exp:
+                    player.level += 1
+                    player.exp = 0
+                    ui.add_notification(f"Level Up! Now Level {player.level}", text_yellow)
+        if any_dead:
+            self.enemies = [enemy for enemy in self.enemies if enemy.is_alive()]
+
+        # Re-bucket enemies at their post-move positions for the combat queries below
+        use_grid = len(self.enemies) >= config.SPATIAL_QUERY_MIN_ENEMIES
+        if use_grid:
+            self.physics.update_spatial_grid(self.enemies)
         
         # Combat - player attacks
-        if getattr(self.player, 'is_attacking', False):
-            if not hasattr(self.player, '_attack_processed') or not self.player._attack_processed:
-                attack_rect = self.player.get_attack_rect()
-                for enemy in self.enemies:
-                    if self.physics.check_collision(attack_rect, enemy.rect):
-                        result = self.combat_system.perform_attack(self.player, enemy)
-                        self.game_ui.add_damage_number(result.damage, enemy.position[0], enemy.position[1] - 20, self.game_ui.COLORS['text_red'])
-                        if result.was_critical:
-                            self.game_ui.add_notification("Critical Hit!", self.game_ui.COLORS['text_yellow'])
-                self.player._attack_processed = True
+        if getattr(player, 'is_attacking', False):
+            if not hasattr(player, '_attack_processed') or not player._attack_processed:
+                attack_rect = player.get_attack_rect()
+                candidates = self._enemies_near(attack_rect, use_grid)
+                for i in attack_rect.collidelistall([enemy.rect for enemy in candidates]):
+                    enemy = candidates[i]
+                    result = perform_attack(player, enemy)
+                    ui.add_damage_number(result.damage, enemy.pos_x, enemy.pos_y - 20, text_red)
+                    if result.was_critical:
+                        ui.add_notification("Critical Hit!", text_yellow)
+                player._attack_processed = True
         else:
-            self.player._attack_processed = False
+            player._attack_processed = False
         
-        # Combat - enemy attacks (only if player is in attack hitbox)
-        for enemy in self.enemies:
-            # Check if player is in enemy's attack rect
-            player_in_attack_rect = self.physics.check_collision(enemy.get_attack_rect(), self.player.rect)
-            
-            # Initialize last attack time if not set
-            if not hasattr(enemy, '_last_attack_time'):
-                enemy._last_attack_time = 0
-            
-            # Check if cooldown has elapsed since last attack
-            current_time = enemy.attack_cooldown  # This counts down, so we check if it reached 0
-            
+        # Combat - enemy attacks (only if player is in attack hitbox). An enemy's
+        # attack rect never extends more than ATTACK_RANGE past its own rect.
+        reach = ATTACK_RANGE * 2
+        player_rect = player.rect
+        # Cooldown counts down; only build attack rects for enemies that reached 0
+        ready = [enemy for enemy in self._enemies_near(player_rect.inflate(reach, reach), use_grid)
+                 if enemy.attack_cooldown == 0]
+        if ready:
             # If player is in attack rect and cooldown is ready (reached 0)
-            if player_in_attack_rect and enemy.attack_cooldown == 0:
+            for i in player_rect.collidelistall([enemy.get_attack_rect() for enemy in ready]):
+                enemy = ready[i]
                 # Attack!
                 enemy.is_attacking = True
-                result = self.combat_system.perform_attack(enemy, self.player)
-                self.game_ui.add_damage_number(result.damage, self.player.position[0], self.player.position[1] - 20, self.game_ui.COLORS['text_red'])
-                print(f"Enemy attack: {enemy.name} hits for {result.damage}")
+                result = perform_attack(enemy, player)
+                ui.add_damage_number(result.damage, player.position[0], player.position[1] - 20, text_red)
+                if config.DEBUG_MODE:
+                    print(f"Enemy attack: {enemy.name} hits for {result.damage}")
                 # Reset cooldown for next attack
                 enemy.attack_cooldown = enemy.base_attack_cooldown
-                if not self.player.is_alive():
-                    self.game_ui.show_dialog("You have been defeated!", speaker="Game Over")
+                if not player.is_alive():
+                    ui.show_dialog("You have been defeated!", speaker="Game Over")
                     self.current_state = "game_over"
 
+    def _enemies_near(self, rect: pygame.Rect, use_grid: bool) -> list:
+        """
+        Return the enemies that may overlap rect, in self.enemies order.
+        
+        Args:
+            rect: World-space query rectangle
+            use_grid: Query the physics spatial grid (must be up to date) instead
+                of returning every enemy
+        """
+        if not use_grid:
+            return self.enemies
+        nearby = {id(enemy) for enemy in self.physics.get_nearby_entities(rect)}
+        if not nearby:
+            return []
+        return [enemy for enemy in self.enemies if id(enemy) in nearby]
+
     def _update_pause(self):
         """Update pause state."""
         # Pause screen is mostly static, just wait for resume
@@ -625,21 +756,38 @@ class Game:
         # TODO: Handle game over logic, restart options, etc.
         pass
 
-    def render(self, screen: Optional[pygame.Surface]):
+    def render(self, screen: Optional[pygame.Surface]) -> Optional[list]:
         """
         Render the current game state to the provided screen.
         
         Args:
             screen: The pygame surface to render to
+
+        Returns:
+            Rects to pass to pygame.display.update() (empty when the frame is
+            unchanged), or None when the whole screen should be flipped
         """
         if not screen and not getattr(self, 'use_gpu', False):
-            return
+            return None
+
+        # Menu/pause/game over screens are static: skip identical frames entirely
+        if not getattr(self, 'use_gpu', False) and self.current_state in ("menu", "paused", "game_over"):
+            frame_key = self._static_frame_key(screen)
+            if frame_key == self._static_frame:
+                return []
+            previous, self._static_frame = self._static_frame, frame_key
+            # Only a menu button's hover highlight changed: repaint just the buttons
+            if self.current_state == "menu" and previous is not None and previous[:2] == frame_key[:2]:
+                return self._redraw_menu_buttons(screen)
+        else:
+            self._static_frame = None
             
         # Clear target
         if getattr(self, 'use_gpu', False):
             # In GPU mode, clear UI surface for menu/pause/game_over; gameplay clears inside
             self._ui_surface.fill(config.BACKGROUND_COLOR)
-        else:
+        elif self.current_state != "playing":
+            # Gameplay clears the screen itself with the floor color
             screen.fill(config.BACKGROUND_COLOR)
         
         # Render based on current game state
@@ -670,31 +818,34 @@ class Game:
                 sw, sh = target.get_size()
                 ui_tex.draw(None, (0, 0, sw, sh), 0)
                 self.renderer.present()
+        return None
+
+    def _static_frame_key(self, screen: pygame.Surface) -> tuple:
+        """Describe everything a menu/pause/game over frame depends on."""
+        if self.current_state == "menu":
+            # Only the button hover highlights change on the main menu
+            mouse_pos = pygame.mouse.get_pos()
+            start_rect = getattr(self, '_menu_start_rect', None)
+            quit_rect = getattr(self, '_menu_quit_rect', None)
+            details = (
+                bool(start_rect and start_rect.collidepoint(mouse_pos)),
+                bool(quit_rect and quit_rect.collidepoint(mouse_pos)),
+            )
+        elif self.current_state == "paused":
+            details = (self.pause_substate, tuple(self.debug_flags.items()))
+        else:
+            details = ()
+        return (self.current_state, screen.get_size(), details)
 
     def _render_menu(self, screen: pygame.Surface):
         """Render the main menu."""
         sw, sh = screen.get_size()
         
-        # Modern gradient background (dark blue to purple)
-        for y in range(sh):
-            ratio = y / max(1, sh)
-            r = int(15 + ratio * 40)
-            g = int(10 + ratio * 20)
-            b = int(30 + ratio * 60)
-            pygame.draw.line(screen, (r, g, b), (0, y), (sw, y))
-        
-        # Decorative top gradient overlay
-        top_overlay = pygame.Surface((sw, 200))
-        for y in range(200):
-            ratio = y / 200
-            alpha = int(255 * (1 - ratio) * 0.3)
-            color = (100 + int(ratio * 50), 50 + int(ratio * 30), 150 + int(ratio * 50))
-            pygame.draw.line(top_overlay, color, (0, y), (sw, y))
-        top_overlay.set_alpha(100)
-        screen.blit(top_overlay, (0, 0))
+        # Modern gradient background (dark blue to purple) with its top overlay baked in
+        screen.blit(self._get_menu_background(sw, sh), (0, 0))
         
         # Title with modern styling
-        title_font = pygame.font.Font(None, 80)
+        title_font = self._get_font(80)
         title_text = title_font.render("INFINITE TOWER", True, (255, 200, 100))
         title_rect = title_text.get_rect(center=(sw // 2, 100))
         # Title glow effect (shadow)
@@ -704,11 +855,29 @@ class Game:
         screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_font = pygame.font.Font(None, 24)
+        subtitle_font = self._get_font(24)
         subtitle_text = subtitle_font.render(f"Engine v{ENGINE_VERSION}", True, (200, 200, 200))
         subtitle_rect = subtitle_text.get_rect(center=(sw // 2, 150))
         screen.blit(subtitle_text, subtitle_rect)
         
+        # Start/Quit buttons (stored for click detection)
+        self._draw_menu_buttons(screen, sw, sh)
+        
+        # Controls hint
+        hint_font = self._get_font(18)
+        hint_text = hint_font.render("In-Game: I/Tab/O: Inventory  |  E: Equipment  |  ESC: Pause", True, (150, 150, 150))
+        hint_rect = hint_text.get_rect(center=(sw // 2, sh - 60))
+        screen.blit(hint_text, hint_rect)
+        
+        # Bottom info bar
+        info_font = self._get_font(16)
+        version_text = info_font.render(f"v{ENGINE_VERSION}", True, (180, 180, 120))
+        copyright_text = info_font.render("© 2025 CosmicPhoenix171 - All Rights Reserved", True, (100, 100, 100))
+        screen.blit(version_text, (15, sh - 25))
+        screen.blit(copyright_text, (sw - copyright_text.get_width() - 15, sh - 25))
+
+    def _draw_menu_buttons(self, screen: pygame.Surface, sw: int, sh: int):
+        """Draw the main menu Start/Quit buttons with their hover highlight."""
         # Modern button boxes
         btn_width, btn_height = 200, 50
         btn_x = sw // 2 - btn_width // 2
@@ -724,7 +893,7 @@ class Game:
         
         pygame.draw.rect(screen, start_color, start_rect)
         pygame.draw.rect(screen, (150, 220, 255), start_rect, 3)
-        start_font = pygame.font.Font(None, 32)
+        start_font = self._get_font(32)
         start_text = start_font.render("START GAME", True, (255, 255, 255))
         start_text_rect = start_text.get_rect(center=start_rect.center)
         screen.blit(start_text, start_text_rect)
@@ -748,23 +917,95 @@ class Game:
         
         # Store for click detection
         self._menu_quit_rect = quit_rect
+
+    def _redraw_menu_buttons(self, screen: pygame.Surface) -> list:
+        """Repaint only the menu buttons over the cached background.
+
+        Returns:
+            The dirty rects to pass to pygame.display.update()
+        """
+        sw, sh = screen.get_size()
+        background = self._get_menu_background(sw, sh)
+        dirty = [self._menu_start_rect, self._menu_quit_rect]
+        for rect in dirty:
+            screen.blit(background, rect, rect)
+        self._draw_menu_buttons(screen, sw, sh)
+        return dirty
+
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """Return a cached default font of the given size."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+
+    def _get_menu_background(self, sw: int, sh: int) -> pygame.Surface:
+        """Return the cached menu gradient, rebuilding it when the size changes."""
+        if self._menu_bg is None or self._menu_bg_size != (sw, sh):
+            # Row colors take only a few dozen distinct values, so fill one rect
+            # per band of identical rows instead of touching every scanline
+            background = pygame.Surface((sw, sh)).convert()
+            palette = [(int(15 + r * 40), int(10 + r * 20), int(30 + r * 60))
+                       for r in (y / max(1, sh) for y in range(sh))]
+            self._fill_row_bands(background, palette)
+
+            # Decorative top gradient overlay, blended in once at build time
+            top_overlay = pygame.Surface((sw, 200)).convert()
+            palette = [(100 + int(r * 50), 50 + int(r * 30), 150 + int(r * 50))
+                       for r in (y / 200 for y in range(200))]
+            self._fill_row_bands(top_overlay, palette)
+            top_overlay.set_alpha(100)
+            background.blit(top_overlay, (0, 0))
+
+            self._menu_bg = background
+            self._menu_bg_size = (sw, sh)
+        return self._menu_bg
+
+    @staticmethod
+    def _fill_row_bands(surface: pygame.Surface, palette: list):
+        """
+        Fill surface row by row from palette, one fill per run of equal colors.
         
-        # Controls hint
-        hint_font = pygame.font.Font(None, 18)
-        hint_text = hint_font.render("In-Game: I/Tab/O: Inventory  |  E: Equipment  |  ESC: Pause", True, (150, 150, 150))
-        hint_rect = hint_text.get_rect(center=(sw // 2, sh - 60))
-        screen.blit(hint_text, hint_rect)
-        
-        # Bottom info bar
-        info_font = pygame.font.Font(None, 16)
-        version_text = info_font.render(f"v{ENGINE_VERSION}", True, (180, 180, 120))
-        copyright_text = info_font.render("© 2025 CosmicPhoenix171 - All Rights Reserved", True, (100, 100, 100))
-        screen.blit(version_text, (15, sh - 25))
-        screen.blit(copyright_text, (sw - copyright_text.get_width() - 15, sh - 25))
+        Args:
+            surface: Target surface; palette[y] is the color of row y
+            palette: Row colors, one per row of surface
+        """
+        width = surface.get_width()
+        band_start = 0
+        for y in range(1, len(palette) + 1):
+            if y == len(palette) or palette[y] != palette[band_start]:
+                surface.fill(palette[band_start], (0, band_start, width, y - band_start))
+                band_start = y
+
+    def _build_world_background(self, size: int, grid_size: int) -> pygame.Surface:
+        """Prerender the floor fill and grid lines for the rotating world surface."""
+        grid_color = (50, 45, 40)
+        surface = pygame.Surface((size, size)).convert()
+        surface.fill((35, 30, 25))  # Fill with background color
+        for x in range(0, size, grid_size):
+            pygame.draw.line(surface, grid_color, (x, 0), (x, size), 1)
+        for y in range(0, size, grid_size):
+            pygame.draw.line(surface, grid_color, (0, y), (size, y), 1)
+        return surface
+
+    def _build_walls_layer(self, walls: list) -> tuple:
+        """Prerender every wall of the floor into one colorkeyed surface.
+
+        Returns:
+            (surface, (x, y)) where (x, y) is the world position of its top-left
+        """
+        bounds = walls[0].rect.unionall([wall.rect for wall in walls[1:]])
+        transparent = (255, 0, 255)
+        surface = pygame.Surface(bounds.size).convert()
+        surface.fill(transparent)
+        surface.set_colorkey(transparent, pygame.RLEACCEL)
+        for wall in walls:
+            wall.draw(surface, rect_override=wall.rect.move(-bounds.x, -bounds.y))
+        return surface, bounds.topleft
 
     def _render_gameplay(self, screen: pygame.Surface):
         """Render gameplay with grid, walls, and entities all rotating together with player perspective."""
-        import math
 
         # Get screen size - from window in GPU mode, from surface in CPU mode
         if getattr(self, 'use_gpu', False):
@@ -782,60 +1023,60 @@ class Game:
             world_size = min(diag, max_tex)
         else:
             world_size = diag
+        grid_size = 32
         if self._world_surface is None or self._world_size != world_size:
             self._world_size = world_size
-            self._world_surface = pygame.Surface((world_size, world_size))
+            # Match the display format once so per-frame blits/rotozoom skip conversion
+            self._world_surface = pygame.Surface((world_size, world_size)).convert()
+            # One grid cell larger than the world surface so it can be shifted by the scroll offset
+            self._world_bg = self._build_world_background(world_size + grid_size, grid_size)
 
         world_surface = self._world_surface
-        world_surface.fill((35, 30, 25))  # Fill with background color
-
-        # 2) Draw grid on world surface (world-space, will rotate with everything)
-        grid_size = 32
-        grid_color = (50, 45, 40)
         world_center_x = world_size // 2
         world_center_y = world_size // 2
-        
+        # World -> world-surface translation (camera centered on player), once per frame
+        view_x = world_center_x - sw // 2 - int(self.camera_x)
+        view_y = world_center_y - sh // 2 - int(self.camera_y)
+
+        # 2) Draw background + grid on world surface (world-space, will rotate with everything)
         # Grid centered around player position in world
         # Calculate grid offset so lines align with world coordinates
         grid_offset_x = int((-self.camera_x) % grid_size)
         grid_offset_y = int((-self.camera_y) % grid_size)
-        
-        # Draw grid lines across the entire world surface
-        for x in range(grid_offset_x - world_size // 2, world_size, grid_size):
-            pygame.draw.line(world_surface, grid_color, (x + world_size // 2, 0), (x + world_size // 2, world_size), 1)
-        for y in range(grid_offset_y - world_size // 2, world_size, grid_size):
-            pygame.draw.line(world_surface, grid_color, (0, y + world_size // 2), (world_size, y + world_size // 2), 1)
+
+        # The prerendered grid covers the whole surface, so no separate fill is needed
+        world_surface.blit(self._world_bg, (grid_offset_x - grid_size, grid_offset_y - grid_size))
 
         # 3) Draw walls on world surface (world-space, will rotate with grid)
         if getattr(self, 'walls', None):
-            for wall in self.walls:
-                # Position relative to camera (centered on player)
-                rel_x = wall.rect.x - int(self.camera_x) + world_center_x - sw // 2
-                rel_y = wall.rect.y - int(self.camera_y) + world_center_y - sh // 2
-                temp = pygame.Rect(rel_x, rel_y, wall.rect.width, wall.rect.height)
-                wall.draw(world_surface, rect_override=temp)
+            if self._walls_layer is None:
+                self._walls_layer, self._walls_origin = self._build_walls_layer(self.walls)
+            # Position relative to camera (centered on player)
+            rel_x = self._walls_origin[0] + view_x
+            rel_y = self._walls_origin[1] + view_y
+            world_surface.blit(self._walls_layer, (rel_x, rel_y))
         
         # 4) Draw enemies on world surface with camera offset
         if self.enemies:
+            # Skip enemies entirely off the world surface; the margin covers the
+            # name label, health bar and attack indicator drawn around the rect
+            cull_margin = 128
+            cull_max = world_size + cull_margin
+            visible = []
             for enemy in self.enemies:
                 # Position relative to camera (centered on player)
-                rel_x = enemy.rect.x - int(self.camera_x) + world_center_x - sw // 2
-                rel_y = enemy.rect.y - int(self.camera_y) + world_center_y - sh // 2
-                
-                # Temporarily adjust enemy position for drawing
-                original_x = enemy.rect.x
-                original_y = enemy.rect.y
-                enemy.rect.x = rel_x
-                enemy.rect.y = rel_y
-                enemy.draw(world_surface)
-                enemy.rect.x = original_x
-                enemy.rect.y = original_y
+                rel_x = enemy.rect.x + view_x
+                rel_y = enemy.rect.y + view_y
+                if (-cull_margin - enemy.rect.width < rel_x < cull_max
+                        and -cull_margin - enemy.rect.height < rel_y < cull_max):
+                    visible.append(enemy)
+            self.enemy_manager.draw_all(world_surface, visible, (view_x, view_y))
         
         # 4b) Draw player's attack rect on world surface so it rotates with the world
         if self.player and getattr(self.player, 'is_attacking', False):
             attack_rect = self.player.get_attack_rect()
-            arx = attack_rect.x - int(self.camera_x) + world_center_x - sw // 2
-            ary = attack_rect.y - int(self.camera_y) + world_center_y - sh // 2
+            arx = attack_rect.x + view_x
+            ary = attack_rect.y + view_y
             pygame.draw.rect(world_surface, (255, 80, 80), pygame.Rect(arx, ary, attack_rect.width, attack_rect.height), 2)
 
         # 4c) Debug overlays drawn on world surface (rotate with world)
@@ -844,27 +1085,26 @@ class Game:
             if self.debug_flags.get('show_collision', False):
                 # Walls
                 for wall in getattr(self, 'walls', []) or []:
-                    rel_x = wall.rect.x - int(self.camera_x) + world_center_x - sw // 2
-                    rel_y = wall.rect.y - int(self.camera_y) + world_center_y - sh // 2
+                    rel_x = wall.rect.x + view_x
+                    rel_y = wall.rect.y + view_y
                     pygame.draw.rect(world_surface, (0, 200, 255), pygame.Rect(rel_x, rel_y, wall.rect.width, wall.rect.height), 1)
                 # Player
                 if self.player:
-                    prx = self.player.rect.x - int(self.camera_x) + world_center_x - sw // 2
-                    pry = self.player.rect.y - int(self.camera_y) + world_center_y - sh // 2
+                    prx = self.player.rect.x + view_x
+                    pry = self.player.rect.y + view_y
                     pygame.draw.rect(world_surface, (0, 255, 150), pygame.Rect(prx, pry, self.player.rect.width, self.player.rect.height), 1)
                 # Enemies
                 for enemy in self.enemies:
-                    erx = enemy.rect.x - int(self.camera_x) + world_center_x - sw // 2
-                    ery = enemy.rect.y - int(self.camera_y) + world_center_y - sh // 2
+                    erx = enemy.rect.x + view_x
+                    ery = enemy.rect.y + view_y
                     pygame.draw.rect(world_surface, (255, 220, 0), pygame.Rect(erx, ery, enemy.rect.width, enemy.rect.height), 1)
 
             # Vision cones
             if self.debug_flags.get('show_vision', False):
                 try:
-                    import math
                     for enemy in self.enemies:
-                        cx = enemy.rect.centerx - int(self.camera_x) + world_center_x - sw // 2
-                        cy = enemy.rect.centery - int(self.camera_y) + world_center_y - sh // 2
+                        cx = enemy.rect.centerx + view_x
+                        cy = enemy.rect.centery + view_y
                         facing = getattr(enemy, 'direction_angle', 0.0)
                         # Get AI FOV/range via enemy.ai
                         fov = getattr(enemy.ai, 'fov_degrees', 90)
@@ -886,10 +1126,10 @@ class Game:
             # AI state labels
             if self.debug_flags.get('show_ai', False):
                 try:
-                    label_font = pygame.font.Font(None, 18)
+                    label_font = self._get_font(18)
                     for enemy in self.enemies:
-                        ex = enemy.rect.centerx - int(self.camera_x) + world_center_x - sw // 2
-                        ey = enemy.rect.top - int(self.camera_y) + world_center_y - sh // 2 - 12
+                        ex = enemy.rect.centerx + view_x
+                        ey = enemy.rect.top + view_y - 12
                         state = None
                         if hasattr(enemy, 'ai') and hasattr(enemy.ai, 'state'):
                             s = enemy.ai.state
@@ -924,7 +1164,7 @@ class Game:
             self.renderer.clear()
 
             # Draw a tiny sanity quad (red square) to ensure renderer output is visible (one-time)
-            if not hasattr(self, '_gpu_sanity_drawn'):
+            if config.DEBUG_MODE and not hasattr(self, '_gpu_sanity_drawn'):
                 try:
                     test_surf = pygame.Surface((128, 128))
                     test_surf.fill((220, 40, 40))
@@ -939,7 +1179,7 @@ class Game:
             angle_gpu = self.camera_angle_smooth - 270
             
             # Debug: print world surface info
-            if not hasattr(self, '_debug_printed'):
+            if config.DEBUG_MODE and not hasattr(self, '_debug_printed'):
                 print(f"[GPU DEBUG] World surface size: {world_surface.get_size()}")
                 print(f"[GPU DEBUG] Screen size: {sw}x{sh}")
                 print(f"[GPU DEBUG] Player position: {self.player.position if self.player else 'None'}")
@@ -996,10 +1236,13 @@ class Game:
         if getattr(self, 'debug_flags', None) and self.debug_flags.get('show_fps', False):
             try:
                 fps = self.clock.get_fps()
-                info = f"FPS: {fps:.1f}  Angle: {self.camera_angle_smooth:.1f}"
-                font = pygame.font.Font(None, 22)
-                txt = font.render(info, True, (230, 230, 230))
-                screen.blit(txt, (10, 6))
+                info = (round(fps, 1), round(self.camera_angle_smooth, 1))
+                # Only re-render when the displayed text actually changes
+                if info != self._fps_value:
+                    text = f"FPS: {info[0]:.1f}  Angle: {info[1]:.1f}"
+                    self._fps_surface = self._get_font(22).render(text, True, (230, 230, 230))
+                    self._fps_value = info
+                screen.blit(self._fps_surface, (10, 6))
             except Exception:
                 pass
 
@@ -1012,15 +1255,16 @@ class Game:
         overlay.set_alpha(140)
         screen.blit(overlay, (0, 0))
 
-        # Base panel
-        panel_w, panel_h = 520, 300
-        panel_x = (sw - panel_w) // 2
-        panel_y = (sh - panel_h) // 2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-        pygame.draw.rect(screen, (34, 34, 48), panel_rect)
-        pygame.draw.rect(screen, config.WHITE, panel_rect, 2)
+        # Base panel (layout and panel surface only change on resize)
+        panel_rect, buttons = self._get_pause_layout(sw, sh)
+        panel_x, panel_y, panel_w, panel_h = panel_rect
+        if self._pause_panel is None:
+            self._pause_panel = pygame.Surface(panel_rect.size).convert()
+            self._pause_panel.fill((34, 34, 48))
+            pygame.draw.rect(self._pause_panel, config.WHITE, self._pause_panel.get_rect(), 2)
+        screen.blit(self._pause_panel, panel_rect)
 
-        title_font = pygame.font.Font(None, 48)
+        title_font = self._get_font(48)
         title = title_font.render("Paused", True, config.WHITE)
         title_rect = title.get_rect(center=(panel_x + panel_w // 2, panel_y + 40))
         screen.blit(title, title_rect)
@@ -1030,8 +1274,7 @@ class Game:
             return
 
         # Buttons
-        buttons = self._compute_pause_buttons()
-        btn_font = pygame.font.Font(None, 32)
+        btn_font = self._get_font(32)
         labels = {
             'resume': 'Resume',
             'debug': 'Debug',
@@ -1049,7 +1292,7 @@ class Game:
         self._debug_ui_rects = {}
         sw, sh = screen.get_size()
         px, py, pw, ph = panel_rect
-        font = pygame.font.Font(None, 28)
+        font = self._get_font(28)
         title = font.render("Debug Options", True, config.WHITE)
         screen.blit(title, (px + 20, py + 80))
 
@@ -1075,7 +1318,7 @@ class Game:
         back_rect = pygame.Rect(px + pw - 140, py + ph - 60, 120, 36)
         pygame.draw.rect(screen, (60, 60, 80), back_rect)
         pygame.draw.rect(screen, config.WHITE, back_rect, 2)
-        back_txt = pygame.font.Font(None, 28).render("Back", True, config.WHITE)
+        back_txt = self._get_font(28).render("Back", True, config.WHITE)
         back_txt_rect = back_txt.get_rect(center=back_rect.center)
         screen.blit(back_txt, back_txt_rect)
         self._debug_back_rect = back_rect
@@ -1088,7 +1331,7 @@ class Game:
         screen.blit(text, text_rect)
 
         # Restart button
-        btn_font = pygame.font.Font(None, 36)
+        btn_font = self._get_font(36)
         restart_rect = pygame.Rect(config.SCREEN_WIDTH // 2 - 80, config.SCREEN_HEIGHT // 2 + 20, 160, 48)
         pygame.draw.rect(screen, (60, 60, 80), restart_rect)
         pygame.draw.rect(screen, config.WHITE, restart_rect, 2)
@@ -1115,6 +1358,12 @@ class Game:
             sw, sh = self.screen.get_size()
         else:
             sw, sh = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        return self._get_pause_layout(sw, sh)[1]
+
+    def _get_pause_layout(self, sw: int, sh: int):
+        """Return the pause panel rect and button rects, recomputed only on resize."""
+        if self._pause_layout is not None and self._pause_layout[0] == (sw, sh):
+            return self._pause_layout[1], self._pause_layout[2]
         panel_w, panel_h = 520, 300
         panel_x = (sw - panel_w) // 2
         panel_y = (sh - panel_h) // 2
@@ -1126,7 +1375,10 @@ class Game:
         resume_rect = pygame.Rect(start_x, y, btn_w, btn_h)
         debug_rect = pygame.Rect(start_x + btn_w + gap, y, btn_w, btn_h)
         quit_rect = pygame.Rect(start_x + (btn_w + gap) * 2, y, btn_w, btn_h)
-        return {'resume': resume_rect, 'debug': debug_rect, 'quit': quit_rect}
+        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
+        buttons = {'resume': resume_rect, 'debug': debug_rect, 'quit': quit_rect}
+        self._pause_layout = ((sw, sh), panel_rect, buttons)
+        return panel_rect, buttons
 
     def cleanup(self):
         """Cleanup resources before exiting."""
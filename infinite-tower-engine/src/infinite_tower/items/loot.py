@@ -7,7 +7,7 @@ Copyright (c) 2025 CosmicPhoenix171. All Rights Reserved.
 import random
 import pygame
 from enum import Enum
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, List
 
 
 class Rarity(Enum):
@@ -262,6 +262,20 @@ class LootGenerator:
         else:
             return self._generate_material(rarity)
     
+    def generate_batch(self, count: int, floor_level: int = 1) -> List[Item]:
+        """
+        Generate several random items at once.
+        
+        Args:
+            count: Number of items to generate
+            floor_level: Current floor number (affects rarity chance)
+            
+        Returns:
+            List of generated items
+        """
+        generate = self.generate_random_item
+        return [generate(floor_level) for _ in range(count)]
+    
     def _roll_rarity(self, floor_level: int) -> Rarity:
         """
         Roll for item rarity based on floor level.
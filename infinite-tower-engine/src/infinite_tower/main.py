@@ -49,20 +49,26 @@ def main():
         # Leave current_state as default 'menu' and just mark running
         game.is_running = True
         
-        # Main game loop
+        # Main game loop. A vsynced GPU renderer already blocks in present(), so
+        # only cap the frame rate ourselves when nothing else paces the loop.
         clock = pygame.time.Clock()
+        vsync_paced = getattr(game, 'use_gpu', False) and getattr(config, 'GPU_VSYNC', True)
+        frame_cap = 0 if vsync_paced else config.FRAME_RATE
         while game.is_running or game.current_state in ("paused", "menu", "game_over"):
             # Handle events
             game.handle_events()
             
             # Update game state with dt
-            dt = clock.tick(config.FRAME_RATE) / 1000.0
+            dt = clock.tick(frame_cap) / 1000.0
             game.update(dt)
             
             # Render the frame (including menu/pause screens)
-            game.render(game.screen if game.screen else None)
+            dirty_rects = game.render(game.screen if game.screen else None)
             if game.screen:
-                pygame.display.flip()
+                if dirty_rects is None:
+                    pygame.display.flip()
+                elif dirty_rects:
+                    pygame.display.update(dirty_rects)
             
     except Exception as e:
         logger.error(f"Fatal error: {e}")
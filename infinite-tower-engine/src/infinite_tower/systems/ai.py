@@ -11,6 +11,10 @@ from typing import Tuple, List, Optional
 from ..systems.physics import Physics
 from ..config import AI_IDLE_AVOID_PROBE
 
+# Same factors math.radians()/math.degrees() use, without the call per frame
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
 
 class AIState(Enum):
     """AI behavior states."""
@@ -42,6 +46,9 @@ class AI:
     - Combat decision-making
     - Multiple AI personality types
     """
+
+    # (obstacle list, packed rect array) shared by all AIs for line-of-sight raycasts
+    _obstacle_cache = (None, None)
     
     def __init__(self, entity, behavior_type: AIBehaviorType = AIBehaviorType.AGGRESSIVE):
         self.entity = entity
@@ -186,8 +193,7 @@ class AI:
             if in_cone:
                 start = self._to_tuple(self.entity.position)
                 end = self._to_tuple(player.position)
-                rects = [getattr(o, 'rect', o) for o in obstacles]
-                hit = Physics.raycast(start, end, rects)
+                hit = Physics.raycast(start, end, self._obstacle_array(obstacles))
                 has_los = (hit is None)
             else:
                 has_los = False
@@ -268,11 +274,20 @@ class AI:
         dist = math.hypot(dx, dy)
         if dist > self.vision_range:
             return False
-        to_player = (math.degrees(math.atan2(dy, dx)) % 360)
+        to_player = (math.atan2(dy, dx) * _RAD2DEG % 360)
         facing = self.entity.direction_angle % 360
         diff = abs((to_player - facing + 540) % 360 - 180)
         return diff <= (self.fov_degrees / 2)
 
+    @classmethod
+    def _obstacle_array(cls, obstacles: List):
+        """Return obstacles packed for Physics.raycast, shared by every AI until the list changes."""
+        cached, array = cls._obstacle_cache
+        if cached is not obstacles or len(array) != len(obstacles):
+            array = Physics.rects_to_array([getattr(o, 'rect', o) for o in obstacles])
+            AI._obstacle_cache = (obstacles, array)
+        return array
+
     def _to_tuple(self, pos) -> Tuple[float, float]:
         if isinstance(pos, list):
             return (pos[0], pos[1])
@@ -300,13 +315,12 @@ class AI:
         # If a wall is AI_IDLE_AVOID_PROBE pixels ahead, turn around (or sharply)
         if obstacles and hasattr(self.entity, 'position') and hasattr(self.entity, 'direction_angle'):
             start = self._to_tuple(self.entity.position)
-            ang_rad = math.radians(self.entity.direction_angle)
+            ang_rad = self.entity.direction_angle * _DEG2RAD
             end = (
                 start[0] + math.cos(ang_rad) * self.avoid_probe,
                 start[1] + math.sin(ang_rad) * self.avoid_probe,
             )
-            rects = [getattr(o, 'rect', o) for o in obstacles]
-            hit = Physics.raycast(start, end, rects)
+            hit = Physics.raycast(start, end, self._obstacle_array(obstacles))
             if hit is not None:
                 # Turn around/sharply to avoid wall
                 turn = random.choice([150, 165, 180, 195, 210])
@@ -344,7 +358,7 @@ class AI:
         # Calculate desired facing angle toward target and set move intent forward
         dx = target_pos[0] - entity_pos[0]
         dy = target_pos[1] - entity_pos[1]
-        ang = math.degrees(math.atan2(dy, dx)) % 360
+        ang = math.atan2(dy, dx) * _RAD2DEG % 360
         if hasattr(self.entity, '_desired_angle'):
             self.entity._desired_angle = ang
         if hasattr(self.entity, '_move_intent'):
@@ -412,7 +426,7 @@ class AI:
         
         if distance > 0:
             # Face away and move forward
-            ang = (math.degrees(math.atan2(dy, dx)) + 180) % 360
+            ang = (math.atan2(dy, dx) * _RAD2DEG + 180) % 360
             if hasattr(self.entity, '_desired_angle'):
                 self.entity._desired_angle = ang
             if hasattr(self.entity, '_move_intent'):
@@ -301,7 +301,7 @@ class CombatSystem:
             if entity_id not in self.active_effects:
                 continue
             
-            effects_to_remove = []
+            remaining = []
             
             for effect in self.active_effects[entity_id]:
                 effect['current_tick'] += 1
@@ -316,16 +316,14 @@ class CombatSystem:
                     entity.health += effect['heal_per_tick']
                     effect['remaining_ticks'] -= 1
                 
-                # Remove expired effects
-                if effect['remaining_ticks'] <= 0:
-                    effects_to_remove.append(effect)
-            
-            # Clean up expired effects
-            for effect in effects_to_remove:
-                self.active_effects[entity_id].remove(effect)
+                # Keep only effects that have ticks left
+                if effect['remaining_ticks'] > 0:
+                    remaining.append(effect)
             
             # Remove entity from active_effects if no effects remain
-            if not self.active_effects[entity_id]:
+            if remaining:
+                self.active_effects[entity_id] = remaining
+            else:
                 del self.active_effects[entity_id]
     
     def heal(self, target, heal_amount: int) -> int:
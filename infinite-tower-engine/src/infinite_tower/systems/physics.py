@@ -6,8 +6,31 @@ Copyright (c) 2025 CosmicPhoenix171. All Rights Reserved.
 
 import pygame
 import math
+import numpy as np
 from typing import List, Tuple, Optional, Set
 
+# Optional JIT for the raycast inner loop; the NumPy path is used without it
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _raycast_kernel(x, y, dx, dy, steps, rects):
+        """Step along the ray and stop at the first sample inside a rect row."""
+        for _ in range(steps):
+            x += dx
+            y += dy
+            px = int(x)
+            py = int(y)
+            for j in range(rects.shape[0]):
+                if rects[j, 0] <= px and px < rects[j, 2] and rects[j, 1] <= py and py < rects[j, 3]:
+                    return True, x, y
+        return False, x, y
+
 
 class Physics:
     """
@@ -34,6 +57,21 @@ class Physics:
         """
         return rect1.colliderect(rect2)
     
+    @staticmethod
+    def batch_aabb(rect: pygame.Rect, rects: np.ndarray) -> np.ndarray:
+        """
+        Check AABB collision between one rectangle and many at once.
+        
+        Args:
+            rect: Rectangle to test
+            rects: (N, 4) array of (left, top, right, bottom) rows, see rects_to_array()
+            
+        Returns:
+            Boolean mask of length N, True where rects[i] overlaps rect
+        """
+        return ((rects[:, 0] < rect.right) & (rects[:, 2] > rect.left) &
+                (rects[:, 1] < rect.bottom) & (rects[:, 3] > rect.top))
+    
     @staticmethod
     def check_circle_collision(pos1: Tuple[float, float], radius1: float,
                               pos2: Tuple[float, float], radius2: float) -> bool:
@@ -332,33 +370,65 @@ class Physics:
         return list(nearby)
     
     # ===== Raycasting =====
+
+    @staticmethod
+    def rects_to_array(rects: List[pygame.Rect]) -> np.ndarray:
+        """
+        Pack rectangles into an array for batched queries such as raycast().
+        
+        Args:
+            rects: List of rectangles
+            
+        Returns:
+            (N, 4) int array of (left, top, right, bottom) rows
+        """
+        return np.array([(r.left, r.top, r.right, r.bottom) for r in rects],
+                        dtype=np.int64).reshape(-1, 4)
     
     @staticmethod
     def raycast(start: Tuple[float, float], end: Tuple[float, float],
-               obstacles: List[pygame.Rect]) -> Optional[Tuple[float, float]]:
+               obstacles) -> Optional[Tuple[float, float]]:
         """
         Simple raycast to check line of sight.
         
+        All sample points are tested against all obstacles in one vectorized
+        pass (or a JIT-compiled loop when numba is installed); the first
+        sample inside any obstacle is the hit.
+        
         Args:
             start: (x, y) starting point
             end: (x, y) ending point
-            obstacles: List of obstacle rectangles
+            obstacles: List of obstacle rectangles, or an array from rects_to_array()
             
         Returns:
             Hit point (x, y) or None if no collision
         """
+        if not isinstance(obstacles, np.ndarray):
+            obstacles = Physics.rects_to_array(obstacles)
+        if len(obstacles) == 0:
+            return None
+
         steps = 100
         dx = (end[0] - start[0]) / steps
         dy = (end[1] - start[1]) / steps
-        
-        x, y = start
-        for _ in range(steps):
-            x += dx
-            y += dy
-            point = (int(x), int(y))
-            
-            for obstacle in obstacles:
-                if obstacle.collidepoint(point):
-                    return (x, y)
-        
-        return None
\ No newline at end of file
+
+        if _NUMBA_AVAILABLE:
+            hit, x, y = _raycast_kernel(float(start[0]), float(start[1]), dx, dy, steps, obstacles)
+            return (x, y) if hit else None
+
+        # Accumulate like repeated `x += dx` so sample points match exactly
+        xs = np.full(steps + 1, dx)
+        ys = np.full(steps + 1, dy)
+        xs[0], ys[0] = start
+        xs = np.cumsum(xs)[1:]
+        ys = np.cumsum(ys)[1:]
+        px = xs.astype(np.int64)[:, None]
+        py = ys.astype(np.int64)[:, None]
+
+        left, top, right, bottom = obstacles.T
+        inside = (left <= px) & (px < right) & (top <= py) & (py < bottom)
+        hits = inside.any(axis=1)
+        if not hits.any():
+            return None
+        i = int(hits.argmax())
+        return (float(xs[i]), float(ys[i]))
\ No newline at end of file
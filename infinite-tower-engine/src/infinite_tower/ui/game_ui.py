@@ -7,6 +7,8 @@ Complete game UI with 16-bit SNES-style aesthetic using placeholder boxes.
 """
 
 import pygame
+import numpy as np
+from collections import deque
 from typing import Optional, List, Tuple
 from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, GREEN, RED, BLUE
 from .. import __version__ as ENGINE_VERSION
@@ -62,22 +64,26 @@ class GameUI:
         'epic': (200, 100, 255),
         'legendary': (255, 150, 0),
     }
+
+    # Maximum damage numbers on screen at once
+    MAX_DAMAGE_NUMBERS = 64
     
     def __init__(self, screen: pygame.Surface, player):
         self.screen = screen
         self.player = player
-        # Width/height are recomputed every frame to support resize/fullscreen
+        # Width/height are rechecked every frame to support resize/fullscreen
         self.width = self.screen.get_width()
         self.height = self.screen.get_height()
+        self._layout_size = None  # Screen size the layout and fonts were built for
         
-        # Dynamic layout (updated each frame for responsive UI)
+        # Dynamic layout (rebuilt when the screen size changes)
         self.scale = 1.0
         self.ui_margin = 8
         self.ui_padding = 4
         self.bar_height = 12
         self.slot_size = 32
 
-        # Fonts (scaled per frame)
+        # Fonts (rescaled with the layout)
         self.font_large = pygame.font.Font(None, 24)
         self.font_medium = pygame.font.Font(None, 20)
         self.font_small = pygame.font.Font(None, 16)
@@ -88,8 +94,13 @@ class GameUI:
         self.show_quickbar = True
         self.show_equipment = False
         
-        # Damage numbers
-        self.damage_numbers = []
+        # Damage numbers: fixed-capacity slots stored as columns (life <= 0 means free)
+        self._dmg_x = np.zeros(self.MAX_DAMAGE_NUMBERS, dtype=np.float32)
+        self._dmg_y = np.zeros(self.MAX_DAMAGE_NUMBERS, dtype=np.float32)
+        self._dmg_life = np.zeros(self.MAX_DAMAGE_NUMBERS, dtype=np.int32)
+        self._dmg_value = np.zeros(self.MAX_DAMAGE_NUMBERS, dtype=np.int32)
+        self._dmg_color: List[Optional[Tuple[int, int, int]]] = [None] * self.MAX_DAMAGE_NUMBERS
+        self._dmg_free = deque(range(self.MAX_DAMAGE_NUMBERS))
         
         # Notifications
         self.notifications = []
@@ -102,9 +113,12 @@ class GameUI:
         self.floor_name = "Tower Entrance"
         
     def _update_layout(self):
-        """Recompute sizing/scale based on current screen size."""
-        self.width = self.screen.get_width()
-        self.height = self.screen.get_height()
+        """Recompute sizing/scale when the screen size has changed."""
+        size = self.screen.get_size()
+        if size == self._layout_size:
+            return
+        self._layout_size = size
+        self.width, self.height = size
         # Reference 1280x720; clamp scale between 0.75 and 2.0
         ref_w, ref_h = 1280, 720
         self.scale = max(0.75, min(2.0, min(self.width / ref_w, self.height / ref_h)))
@@ -421,30 +435,31 @@ class GameUI:
     
     def _draw_damage_numbers(self):
         """Draw floating damage numbers (16-bit style)."""
-        for dmg_num in self.damage_numbers[:]:
-            # Update position (float upward)
-            dmg_num['y'] -= 1
-            dmg_num['life'] -= 1
-            
-            # Remove if expired
-            if dmg_num['life'] <= 0:
-                self.damage_numbers.remove(dmg_num)
-                continue
-            
-            # Fade out
-            alpha = int(255 * (dmg_num['life'] / 60))
-            
+        active = self._dmg_life > 0
+        if not active.any():
+            return
+
+        # Update position (float upward) and age every live slot at once
+        self._dmg_y[active] -= 1
+        self._dmg_life[active] -= 1
+
+        # Return expired slots to the free list
+        self._dmg_free.extend(np.flatnonzero(active & (self._dmg_life <= 0)).tolist())
+
+        for i in np.flatnonzero(self._dmg_life > 0).tolist():
+            x, y = float(self._dmg_x[i]), float(self._dmg_y[i])
+
             # Draw with pixel-perfect positioning
-            text = str(int(dmg_num['damage']))
-            color = dmg_num['color']
+            text = str(int(self._dmg_value[i]))
+            color = self._dmg_color[i]
             
             # Make damage text larger and bold-looking
             text_surface = self.font_large.render(text, True, color)
             
             # Shadow for depth
             shadow_surface = self.font_large.render(text, True, BLACK)
-            self.screen.blit(shadow_surface, (dmg_num['x'] + 1, dmg_num['y'] + 1))
-            self.screen.blit(text_surface, (dmg_num['x'], dmg_num['y']))
+            self.screen.blit(shadow_surface, (x + 1, y + 1))
+            self.screen.blit(text_surface, (x, y))
     
     def _draw_notifications(self):
         """Draw notification messages (right side, below equipment)."""
@@ -571,14 +586,17 @@ class GameUI:
         """Add a damage number to display."""
         if color is None:
             color = self.COLORS['text_red']
-        
-        self.damage_numbers.append({
-            'damage': damage,
-            'x': x,
-            'y': y,
-            'color': color,
-            'life': 60  # frames
-        })
+
+        if self._dmg_free:
+            slot = self._dmg_free.popleft()
+        else:
+            # All slots busy: reuse the one closest to expiring
+            slot = int(np.argmin(self._dmg_life))
+        self._dmg_x[slot] = x
+        self._dmg_y[slot] = y
+        self._dmg_value[slot] = int(damage)
+        self._dmg_color[slot] = color
+        self._dmg_life[slot] = 60  # frames
     
     def add_notification(self, text: str, color: Tuple[int, int, int] = None):
         """Add a notification message."""
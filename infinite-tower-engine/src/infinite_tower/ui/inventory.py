@@ -129,11 +129,13 @@ class InventoryUI:
                     return True
         
         elif event.type == pygame.MOUSEMOTION:
-            # Update hovered slot
-            mouse_pos = pygame.mouse.get_pos()
-            self.hovered_slot = self._get_slot_at_position(mouse_pos)
+            self.update_hover()
         
         return False
+
+    def update_hover(self):
+        """Update the hovered slot from the current mouse position."""
+        self.hovered_slot = self._get_slot_at_position(pygame.mouse.get_pos())
     
     def _get_slot_at_position(self, pos: Tuple[int, int]) -> Optional[int]:
         """
@@ -42,6 +42,17 @@ class InputHandler:
         # Fallback: check event-based key tracking
         return self.keys.get(key, False)
 
+    def get_keystate(self):
+        """
+        Get this frame's keyboard state for reading many keys at once.
+        
+        Returns:
+            The pygame.key.get_pressed() result; index it with pygame.K_* constants
+        """
+        if self._pressed_keys_array is None:
+            self._pressed_keys_array = pygame.key.get_pressed()
+        return self._pressed_keys_array
+
     def get_mouse_button(self, button):
         """Check if a specific mouse button is currently pressed."""
         return self.mouse_buttons.get(button, False)
@@ -33,8 +33,8 @@ class Timer:
             self.start_time = self.current_time()
 
     def current_time(self):
-        """Get the current system time in seconds."""
-        return time.time()
+        """Get a monotonic timestamp in seconds (only differences are meaningful)."""
+        return time.perf_counter()
 
     def get_elapsed_time(self):
         """Get the total elapsed time in seconds."""